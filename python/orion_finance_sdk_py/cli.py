@@ -90,7 +90,7 @@ def _submit_order_logic(order_intent_path: str):
 
     config = OrionConfig()
 
-    if vault_address in config.orion_transparent_vaults:
+    if config.is_orion_vault(vault_address):
         output_order_intent = validate_order(order_intent=order_intent)
         vault = OrionTransparentVault()
         tx_result = vault.submit_order_intent(order_intent=output_order_intent)
@@ -112,7 +112,7 @@ def _update_strategist_logic(new_strategist_address: str):
     )
 
     config = OrionConfig()
-    if vault_address in config.orion_transparent_vaults:
+    if config.is_orion_vault(vault_address):
         vault = OrionTransparentVault()
     else:
         raise ValueError(f"Vault address {vault_address} not in OrionConfig contract.")
@@ -135,7 +135,7 @@ def _update_fee_model_logic(
     )
 
     config = OrionConfig()
-    if vault_address in config.orion_transparent_vaults:
+    if config.is_orion_vault(vault_address):
         vault = OrionTransparentVault()
     else:
         raise ValueError(f"Vault address {vault_address} not in OrionConfig contract.")
@@ -157,7 +157,7 @@ def _update_deposit_access_control_logic(new_dac_address: str):
     )
 
     config = OrionConfig()
-    if vault_address in config.orion_transparent_vaults:
+    if config.is_orion_vault(vault_address):
         vault = OrionTransparentVault()
     else:
         raise ValueError(f"Vault address {vault_address} not in OrionConfig contract.")
@@ -176,7 +176,7 @@ def _claim_fees_logic(amount: int):
 
     config = OrionConfig()
 
-    if vault_address in config.orion_transparent_vaults:
+    if config.is_orion_vault(vault_address):
         vault = OrionTransparentVault()
         tx_result = vault.transfer_manager_fees(amount)
         format_transaction_logs(tx_result, "Manager fees claimed successfully!")
@@ -193,7 +193,7 @@ def _get_pending_fees_logic():
     )
 
     config = OrionConfig()
-    if vault_address in config.orion_transparent_vaults:
+    if config.is_orion_vault(vault_address):
         vault = OrionTransparentVault()
     else:
         raise ValueError(f"Vault address {vault_address} not in OrionConfig contract.")
@@ -3,10 +3,22 @@
 import json
 import os
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from importlib import resources
+from pathlib import Path
 
 from dotenv import load_dotenv
+from eth_abi.exceptions import DecodingError
+from eth_account.signers.local import LocalAccount
+from eth_utils import event_abi_to_log_topic
 from web3 import Web3
+from web3.exceptions import (
+    InvalidEventABI,
+    LogTopicError,
+    MismatchedABI,
+    TimeExhausted,
+    Web3RPCError,
+)
 from web3.types import TxReceipt
 
 from .types import CHAIN_CONFIG, ZERO_ADDRESS, VaultType
@@ -17,6 +29,7 @@ from .utils import (
 )
 
 load_dotenv()
+_cwd_dotenv_loaded = False
 
 # Gas limit for eth_call (view) when using Hardhat fork (node cap 16M)
 _VIEW_CALL_GAS = 15_000_000
@@ -35,6 +48,43 @@ def _call_view(contract_fn):
     return contract_fn.call(_get_view_call_tx())
 
 
+def _load_cwd_dotenv():
+    """Load ./.env once per process (fallback when RPC_URL is not set)."""
+    global _cwd_dotenv_loaded
+    if not _cwd_dotenv_loaded:
+        load_dotenv(os.getcwd() + "/.env")
+        _cwd_dotenv_loaded = True
+
+
+# Minimal ABI for IOrionAccessControl to check permissions
+_ACCESS_CONTROL_ABI = [
+    {
+        "inputs": [{"internalType": "address", "name": "sender", "type": "address"}],
+        "name": "canRequestDeposit",
+        "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
+        "stateMutability": "view",
+        "type": "function",
+    }
+]
+
+
+@lru_cache(maxsize=128)
+def _access_control_contract(w3: Web3, address: str):
+    """Return the IOrionAccessControl contract at an address, built once per client."""
+    return w3.eth.contract(address=address, abi=_ACCESS_CONTROL_ABI)
+
+
+@lru_cache(maxsize=4096)
+def _to_checksum(address: str) -> str:
+    """Return the EIP-55 checksum form of an address, memoised per input."""
+    return Web3.to_checksum_address(address)
+
+
+def _utf8_length(value: str) -> int:
+    """Return the UTF-8 byte length of a string, skipping the encode for ASCII."""
+    return len(value) if value.isascii() else len(value.encode("utf-8"))
+
+
 @dataclass
 class TransactionResult:
     """Result of a transaction including receipt and extracted logs."""
@@ -44,26 +94,93 @@ class TransactionResult:
     decoded_logs: list[dict] | None = None
 
 
+@dataclass(frozen=True)
+class OrionConfigSnapshot:
+    """Protocol parameters read from OrionConfig in a single batched request."""
+
+    underlying_asset: str
+    strategist_intent_decimals: int
+    risk_free_rate: int
+    min_deposit_amount: int
+    min_redeem_amount: int
+    v_fee_coefficient: int
+    rs_fee_coefficient: int
+    fee_change_cooldown_duration: int
+    max_fulfill_batch_size: int
+
+
+# OrionConfigSnapshot field -> OrionConfig view function
+_SNAPSHOT_FUNCTIONS = {
+    "underlying_asset": "underlyingAsset",
+    "strategist_intent_decimals": "strategistIntentDecimals",
+    "risk_free_rate": "riskFreeRate",
+    "min_deposit_amount": "minDepositAmount",
+    "min_redeem_amount": "minRedeemAmount",
+    "v_fee_coefficient": "vFeeCoefficient",
+    "rs_fee_coefficient": "rsFeeCoefficient",
+    "fee_change_cooldown_duration": "feeChangeCooldownDuration",
+    "max_fulfill_batch_size": "maxFulfillBatchSize",
+}
+
+
 class SystemNotIdleError(RuntimeError):
     """Raised when the protocol is not idle for the requested operation."""
 
 
+class TransactionBatchError(RuntimeError):
+    """Raised when some transactions sent by ``OrionVault.execute_many`` did not succeed.
+
+    The transactions it covers are already on chain or pending, with their
+    nonces used: ``tx_hashes`` lists every one that was broadcast, in call
+    order, and ``results`` the TransactionResult of each (check
+    ``receipt["status"]``), or None where no receipt could be read. If
+    broadcasting stopped early, the remaining calls were never sent and the
+    error is chained from the sending failure.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        tx_hashes: list[str],
+        results: list[TransactionResult | None],
+    ):
+        """Record the broadcast hashes and per-transaction results."""
+        super().__init__(message)
+        self.tx_hashes = tx_hashes
+        self.results = results
+
+
+# ABIs next to the package in a source checkout
+_DEV_ABI_DIR = Path(__file__).resolve().parent.parent / "abis"
+
+
+@lru_cache(maxsize=None)
 def load_contract_abi(contract_name: str) -> list[dict]:
-    """Load the ABI for a given contract."""
-    try:
-        # Try to load from package data (when installed from PyPI)
-        with (
-            resources.files("orion_finance_sdk_py")
-            .joinpath("abis", f"{contract_name}.json")
-            .open() as f
-        ):
-            return json.load(f)["abi"]
-    except (FileNotFoundError, AttributeError):
-        # Fallback to local development path
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        abi_path = os.path.join(script_dir, "..", "abis", f"{contract_name}.json")
-        with open(abi_path) as f:
-            return json.load(f)["abi"]
+    """Load the ABI for a given contract.
+
+    ABIs are read and parsed once per process; the returned list is shared
+    between callers and must not be mutated.
+    """
+    # Package data when installed from PyPI, else the local development path
+    abi_file = resources.files("orion_finance_sdk_py").joinpath(
+        "abis", f"{contract_name}.json"
+    )
+    if not abi_file.is_file():
+        abi_file = _DEV_ABI_DIR / f"{contract_name}.json"
+    with abi_file.open() as f:
+        return json.load(f)["abi"]
+
+
+@lru_cache(maxsize=None)
+def _get_web3(rpc_url: str) -> Web3:
+    """Return the Web3 client for an RPC URL, shared by every contract using it."""
+    return Web3(Web3.HTTPProvider(rpc_url))
+
+
+@lru_cache(maxsize=None)
+def _get_chain_id(rpc_url: str) -> int:
+    """Return the chain ID served by an RPC URL, read once per endpoint."""
+    return _get_web3(rpc_url).eth.chain_id
 
 
 class OrionSmartContract:
@@ -71,10 +188,12 @@ class OrionSmartContract:
 
     def __init__(self, contract_name: str, contract_address: str):
         """Initialize a smart contract."""
+        # Signer accounts derived by this instance, keyed by env var name
+        self._accounts: dict[str, tuple[str, LocalAccount]] = {}
         rpc_url = os.getenv("RPC_URL")
         if not rpc_url:
             # Try loading from current directory explicitly
-            load_dotenv(os.getcwd() + "/.env")
+            _load_cwd_dotenv()
             rpc_url = os.getenv("RPC_URL")
 
         ape_error = None
@@ -116,8 +235,8 @@ class OrionSmartContract:
             ),
         )
 
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
-        self.chain_id = self.w3.eth.chain_id
+        self.w3 = _get_web3(rpc_url)
+        self.chain_id = _get_chain_id(rpc_url)
 
         env_chain_id = os.getenv("CHAIN_ID")
         if env_chain_id:
@@ -142,34 +261,151 @@ class OrionSmartContract:
         """Wait for a transaction to be processed and return the receipt."""
         return self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
 
+    def _signer_account(self, key_env: str, error_message: str | None = None):
+        """Return the local account for the private key held in ``key_env``."""
+        private_key = os.getenv(key_env)
+        validate_var(
+            private_key,
+            error_message=error_message
+            or (
+                f"{key_env} environment variable is missing or invalid. "
+                f"Please set {key_env} in your .env file or as an environment variable. "
+                "Follow the SDK Installation instructions to get one: https://sdk.orionfinance.ai/"
+            ),
+        )
+        cached = self._accounts.get(key_env)
+        if cached is None or cached[0] != private_key:
+            cached = (private_key, self.w3.eth.account.from_key(private_key))
+            self._accounts[key_env] = cached
+        return cached[1]
+
+    def _account_state(self, address: str) -> tuple[int, int, int]:
+        """Fetch the nonce, gas price and balance of an address in one batch."""
+        with self.w3.batch_requests() as batch:
+            batch.add(self.w3.eth.get_transaction_count(address))
+            batch.add(self.w3.eth.gas_price)
+            batch.add(self.w3.eth.get_balance(address))
+            nonce, gas_price, balance = batch.execute()
+        return nonce, gas_price, balance
+
+    def _build_transaction(
+        self,
+        account,
+        contract_fn_call,
+        gas_limit: int | None = None,
+        *,
+        legacy_gas_price: bool = False,
+    ) -> dict:
+        """Build a transaction with its nonce and chain ID supplied up front.
+
+        By default web3 fills in the fee fields (EIP-1559 where the chain
+        supports it) and, unless ``gas_limit`` is given, the gas estimate.
+        With ``legacy_gas_price`` the nonce, gas price and gas estimate are
+        read in a single JSON-RPC batch instead, the estimate gets a 20%
+        buffer, and build_transaction makes no further requests.
+        """
+        if not legacy_gas_price:
+            tx_params = {
+                "from": account.address,
+                "nonce": self.w3.eth.get_transaction_count(account.address),
+                "chainId": self.chain_id,
+            }
+            if gas_limit is not None:
+                tx_params["gas"] = gas_limit
+            return contract_fn_call.build_transaction(tx_params)
+
+        with self.w3.batch_requests() as batch:
+            batch.add(self.w3.eth.get_transaction_count(account.address))
+            batch.add(self.w3.eth.gas_price)
+            if gas_limit is None:
+                batch.add(contract_fn_call.estimate_gas({"from": account.address}))
+            nonce, gas_price, *estimate = batch.execute()
+
+        if gas_limit is None:
+            gas_limit = int(estimate[0] * 1.2)
+
+        return contract_fn_call.build_transaction(
+            {
+                "from": account.address,
+                "nonce": nonce,
+                "gas": gas_limit,
+                "gasPrice": gas_price,
+                "chainId": self.chain_id,
+            }
+        )
+
+    def _send_transaction(self, account, tx: dict) -> TransactionResult:
+        """Sign and send a transaction, wait for it and decode its logs."""
+        result = self._transaction_result(self._submit_transaction(account, tx))
+        if result.receipt["status"] != 1:
+            raise Exception(
+                f"Transaction failed with status: {result.receipt['status']}"
+            )
+        return result
+
+    def _submit_transaction(self, account, tx: dict) -> str:
+        """Sign and broadcast a transaction without waiting; return its hex hash."""
+        signed = account.sign_transaction(tx)
+        return self.w3.eth.send_raw_transaction(signed.raw_transaction).hex()
+
+    def _transaction_result(self, tx_hash_hex: str) -> TransactionResult:
+        """Wait for a sent transaction and decode its logs (none if it reverted)."""
+        receipt = self._wait_for_transaction_receipt(tx_hash_hex)
+        return TransactionResult(
+            tx_hash=tx_hash_hex,
+            receipt=receipt,
+            decoded_logs=self._decode_logs(receipt) if receipt["status"] == 1 else None,
+        )
+
+    @cached_property
+    def _checksum_address(self) -> str:
+        """Contract address in the checksum form web3 uses for receipt logs."""
+        return _to_checksum(self.contract_address)
+
+    @cached_property
+    def _events_by_topic(self) -> dict[bytes, object]:
+        """Map each non-anonymous event's topic0 to its contract event."""
+        return {
+            event_abi_to_log_topic(event.abi): event
+            for event in self.contract.events
+            if not event.abi.get("anonymous")
+        }
+
     def _decode_logs(self, receipt: TxReceipt) -> list[dict]:
         """Decode logs from a transaction receipt."""
         decoded_logs = []
+        # Every log in a receipt shares its block and transaction hashes
+        block_hash = tx_hash = None
         for log in receipt.logs:
             # Only process logs from this contract
-            if log.address.lower() != self.contract_address.lower():
+            if log.address != self._checksum_address or not log.topics:
                 continue
 
-            # Try to decode the log with each event in the contract
-            for event in self.contract.events:
-                try:
-                    decoded_log = event.process_log(log)
-                    decoded_logs.append(
-                        {
-                            "event": decoded_log.event,
-                            "args": dict(decoded_log.args),
-                            "address": decoded_log.address,
-                            "blockHash": decoded_log.blockHash.hex(),
-                            "blockNumber": decoded_log.blockNumber,
-                            "logIndex": decoded_log.logIndex,
-                            "transactionHash": decoded_log.transactionHash.hex(),
-                            "transactionIndex": decoded_log.transactionIndex,
-                        }
-                    )
-                    break  # Successfully decoded, move to next log
-                except Exception:
-                    # This event doesn't match this log, try the next event
-                    continue
+            event = self._events_by_topic.get(log.topics[0])
+            if event is None:
+                continue
+
+            try:
+                decoded_log = event.process_log(log)
+            except (MismatchedABI, LogTopicError, InvalidEventABI, DecodingError):
+                # Topic matches but the layout does not (e.g. a stale ABI); the
+                # transaction still landed, so skip the log rather than fail.
+                continue
+            if tx_hash is None:
+                block_hash = decoded_log.blockHash.hex()
+                tx_hash = decoded_log.transactionHash.hex()
+            decoded_logs.append(
+                {
+                    "event": decoded_log.event,
+                    "args": dict(decoded_log.args),
+                    "address": decoded_log.address,
+                    "blockHash": block_hash,
+                    "blockNumber": decoded_log.blockNumber,
+                    "logIndex": decoded_log.logIndex,
+                    "transactionHash": tx_hash,
+                    "transactionIndex": decoded_log.transactionIndex,
+                }
+            )
         return decoded_logs
 
 
@@ -196,13 +432,15 @@ class OrionConfig(OrionSmartContract):
             contract_name="OrionConfig",
             contract_address=contract_address,
         )
+        # ERC-20 decimals never change, so each token is looked up once.
+        self._token_decimals: dict[str, int] = {}
 
-    @property
+    @cached_property
     def underlying_asset(self) -> str:
         """Fetch the underlying asset address."""
         return _call_view(self.contract.functions.underlyingAsset())
 
-    @property
+    @cached_property
     def strategist_intent_decimals(self) -> int:
         """Fetch the strategist intent decimals from the OrionConfig contract."""
         return _call_view(self.contract.functions.strategistIntentDecimals())
@@ -214,7 +452,11 @@ class OrionConfig(OrionSmartContract):
 
     def token_decimals(self, token_address: str) -> int:
         """Fetch the decimals of a token address."""
-        return _call_view(self.contract.functions.getTokenDecimals(token_address))
+        if token_address not in self._token_decimals:
+            self._token_decimals[token_address] = _call_view(
+                self.contract.functions.getTokenDecimals(token_address)
+            )
+        return self._token_decimals[token_address]
 
     @property
     def risk_free_rate(self) -> int:
@@ -239,27 +481,35 @@ class OrionConfig(OrionSmartContract):
     def is_whitelisted(self, token_address: str) -> bool:
         """Check if a token address is whitelisted."""
         return _call_view(
-            self.contract.functions.isWhitelisted(
-                Web3.to_checksum_address(token_address)
-            )
+            self.contract.functions.isWhitelisted(_to_checksum(token_address))
         )
 
     def is_whitelisted_manager(self, manager_address: str) -> bool:
         """Check if a manager address is whitelisted."""
         return _call_view(
-            self.contract.functions.isWhitelistedManager(
-                Web3.to_checksum_address(manager_address)
-            )
+            self.contract.functions.isWhitelistedManager(_to_checksum(manager_address))
         )
 
     def is_orion_vault(self, vault_address: str) -> bool:
         """Check if an address is a registered Orion vault."""
         return _call_view(
-            self.contract.functions.isOrionVault(
-                Web3.to_checksum_address(vault_address)
-            )
+            self.contract.functions.isOrionVault(_to_checksum(vault_address))
         )
 
+    def are_orion_vaults(self, vault_addresses) -> list[bool]:
+        """Check several addresses against the vault registry in one JSON-RPC batch."""
+        vault_addresses = list(vault_addresses)
+        if not vault_addresses:
+            return []
+        with self.w3.batch_requests() as batch:
+            for vault_address in vault_addresses:
+                batch.add(
+                    self.contract.functions.isOrionVault(
+                        _to_checksum(vault_address)
+                    ).call(_get_view_call_tx())
+                )
+            return list(batch.execute())
+
     @property
     def orion_transparent_vaults(self) -> list[str]:
         """Fetch all Orion transparent vault addresses from the OrionConfig contract."""
@@ -299,13 +549,53 @@ class OrionConfig(OrionSmartContract):
         """Check if the system is in idle state, required for vault deployment."""
         return _call_view(self.contract.functions.isSystemIdle())
 
+    def snapshot(self) -> OrionConfigSnapshot:
+        """Fetch the protocol parameters in one JSON-RPC batch.
+
+        Use this instead of reading several properties back to back; the
+        result is frozen, so it stays consistent for the rest of an operation.
+        """
+        with self.w3.batch_requests() as batch:
+            for fn_name in _SNAPSHOT_FUNCTIONS.values():
+                batch.add(
+                    getattr(self.contract.functions, fn_name)().call(
+                        _get_view_call_tx()
+                    )
+                )
+            results = batch.execute()
+        return OrionConfigSnapshot(**dict(zip(_SNAPSHOT_FUNCTIONS, results)))
+
+
+def _get_config() -> OrionConfig:
+    """Return the OrionConfig shared by the SDK for the current environment.
+
+    Keyed on the variables that select the node and the contract, so reloading
+    .env with different values still yields a fresh instance. Without RPC_URL
+    the config binds to whichever ape provider is active, so it is built anew
+    each time rather than kept past that provider's context.
+    """
+    rpc_url = os.getenv("RPC_URL")
+    if not rpc_url:
+        return OrionConfig()
+    return _config_for(
+        rpc_url, os.getenv("ORION_CONFIG_ADDRESS"), os.getenv("CHAIN_ID")
+    )
+
+
+@lru_cache(maxsize=None)
+def _config_for(
+    rpc_url: str, config_address: str | None, chain_id: str | None
+) -> OrionConfig:
+    """Build the OrionConfig for one environment (see _get_config)."""
+    return OrionConfig()
+
 
 class LiquidityOrchestrator(OrionSmartContract):
     """LiquidityOrchestrator contract."""
 
     def __init__(self):
         """Initialize the LiquidityOrchestrator contract."""
-        config = OrionConfig()
+        config = _get_config()
         contract_address = _call_view(config.contract.functions.liquidityOrchestrator())
         super().__init__(
             contract_name="LiquidityOrchestrator",
@@ -338,7 +628,7 @@ class VaultFactory(OrionSmartContract):
     ):
         """Initialize the VaultFactory contract."""
         if contract_address is None:
-            config = OrionConfig()
+            config = _get_config()
             if vault_type == VaultType.TRANSPARENT:
                 contract_address = _call_view(
                     config.contract.functions.transparentVaultFactory()
@@ -362,7 +652,7 @@ class VaultFactory(OrionSmartContract):
         deposit_access_control: str = ZERO_ADDRESS,
     ) -> TransactionResult:
         """Create an Orion vault for a given strategist address."""
-        config = OrionConfig()
+        config = _get_config()
 
         validate_var(
             strategist_address,
@@ -372,31 +662,10 @@ class VaultFactory(OrionSmartContract):
             ),
         )
 
-        manager_private_key = os.getenv("MANAGER_PRIVATE_KEY")
-        validate_var(
-            manager_private_key,
-            error_message=(
-                "MANAGER_PRIVATE_KEY environment variable is missing or invalid. "
-                "Please set MANAGER_PRIVATE_KEY in your .env file or as an environment variable. "
-                "Follow the SDK Installation instructions to get one: https://sdk.orionfinance.ai/"
-            ),
-        )
-        account = self.w3.eth.account.from_key(manager_private_key)
-        validate_var(
-            account.address,
-            error_message="Invalid MANAGER_PRIVATE_KEY.",
-        )
-
-        if not config.is_whitelisted_manager(account.address):
-            raise ValueError(
-                f"Manager {account.address} is not whitelisted to create vaults. "
-                "Please contact the Orion Finance team to get whitelisted."
-            )
-
-        if len(name.encode("utf-8")) > 26:
+        if _utf8_length(name) > 26:
             raise ValueError(f"Vault name '{name}' exceeds maximum length of 26 bytes.")
 
-        if len(symbol.encode("utf-8")) > 4:
+        if _utf8_length(symbol) > 4:
             raise ValueError(
                 f"Vault symbol '{symbol}' exceeds maximum length of 4 bytes."
             )
@@ -411,31 +680,44 @@ class VaultFactory(OrionSmartContract):
                 f"Management fee {management_fee} exceeds maximum {MAX_MANAGEMENT_FEE}"
             )
 
+        account = self._signer_account("MANAGER_PRIVATE_KEY")
+        validate_var(
+            account.address,
+            error_message="Invalid MANAGER_PRIVATE_KEY.",
+        )
+
+        if not config.is_whitelisted_manager(account.address):
+            raise ValueError(
+                f"Manager {account.address} is not whitelisted to create vaults. "
+                "Please contact the Orion Finance team to get whitelisted."
+            )
+
         if not config.is_system_idle():
             raise SystemNotIdleError(
                 "System is not idle. Cannot deploy vault at this time."
             )
 
-        account = self.w3.eth.account.from_key(manager_private_key)
-        nonce = self.w3.eth.get_transaction_count(account.address)
+        nonce, gas_price, balance = self._account_state(account.address)
 
-        # Estimate gas needed for the transaction
-        gas_estimate = self.contract.functions.createVault(
+        create_vault = self.contract.functions.createVault(
             strategist_address,
             name,
             symbol,
             fee_type,
             performance_fee,
             management_fee,
-            Web3.to_checksum_address(deposit_access_control),
-        ).estimate_gas({"from": account.address, "nonce": nonce})
+            _to_checksum(deposit_access_control),
+        )
+
+        # Estimate gas needed for the transaction
+        gas_estimate = create_vault.estimate_gas(
+            {"from": account.address, "nonce": nonce}
+        )
 
         # Add 20% buffer to gas estimate
         gas_limit = int(gas_estimate * 1.2)
 
-        gas_price = self.w3.eth.gas_price
         estimated_cost = gas_limit * gas_price
-        balance = self.w3.eth.get_balance(account.address)
 
         if balance < estimated_cost:
             required_eth = self.w3.from_wei(estimated_cost, "ether")
@@ -444,48 +726,25 @@ class VaultFactory(OrionSmartContract):
                 f"Insufficient ETH balance. Required: {required_eth} ETH, Available: {available_eth} ETH"
             )
 
-        tx = self.contract.functions.createVault(
-            strategist_address,
-            name,
-            symbol,
-            fee_type,
-            performance_fee,
-            management_fee,
-            Web3.to_checksum_address(deposit_access_control),
-        ).build_transaction(
+        tx = create_vault.build_transaction(
             {
                 "from": account.address,
                 "nonce": nonce,
                 "gas": gas_limit,
-                "gasPrice": self.w3.eth.gas_price,
+                "gasPrice": gas_price,
+                "chainId": self.chain_id,
             }
         )
 
-        signed = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-        tx_hash_hex = tx_hash.hex()
-
         try:
-            receipt = self._wait_for_transaction_receipt(tx_hash_hex)
+            return self._send_transaction(account, tx)
         except Exception as e:
-            error_str = str(e)
-            if "0xea8e4eb5" in error_str:
+            if "0xea8e4eb5" in str(e):
                 raise ValueError(
                     f"Transaction reverted: Manager {account.address} is not whitelisted to create vaults."
                 )
             raise e
 
-        # Check if transaction was successful
-        if receipt["status"] != 1:
-            raise Exception(f"Transaction failed with status: {receipt['status']}")
-
-        # Decode logs from the transaction receipt
-        decoded_logs = self._decode_logs(receipt)
-
-        return TransactionResult(
-            tx_hash=tx_hash_hex, receipt=receipt, decoded_logs=decoded_logs
-        )
-
     def get_vault_address_from_result(self, result: TransactionResult) -> str | None:
         """Extract the vault address from OrionVaultCreated event in the transaction result."""
         if not result.decoded_logs:
@@ -501,9 +760,9 @@ class VaultFactory(OrionSmartContract):
 class OrionVault(OrionSmartContract):
     """OrionVault contract."""
 
-    def __init__(self, contract_name: str):
-        """Initialize the OrionVault contract."""
-        contract_address = os.getenv("ORION_VAULT_ADDRESS")
+    def __init__(self, contract_name: str, contract_address: str | None = None):
+        """Initialize the OrionVault contract (default address: ORION_VAULT_ADDRESS)."""
+        contract_address = contract_address or os.getenv("ORION_VAULT_ADDRESS")
         validate_var(
             contract_address,
             error_message=(
@@ -514,7 +773,7 @@ class OrionVault(OrionSmartContract):
         )
 
         # Validate that the address is a valid Orion Vault
-        config = OrionConfig()
+        config = _get_config()
         is_transparent = config.is_orion_vault(contract_address)
 
         if not is_transparent:
@@ -525,19 +784,19 @@ class OrionVault(OrionSmartContract):
 
         super().__init__(contract_name, contract_address)
 
-    @property
+    @cached_property
     def max_performance_fee(self) -> int:
         """Fetch the maximum performance fee allowed from the vault contract."""
         return _call_view(self.contract.functions.MAX_PERFORMANCE_FEE())
 
-    @property
+    @cached_property
     def max_management_fee(self) -> int:
         """Fetch the maximum management fee allowed from the vault contract."""
         return _call_view(self.contract.functions.MAX_MANAGEMENT_FEE())
 
-    @property
+    @cached_property
     def manager_address(self) -> str:
-        """Fetch the manager address."""
+        """Fetch the manager address (fixed for the lifetime of a vault)."""
         return _call_view(self.contract.functions.manager())
 
     @property
@@ -564,14 +823,14 @@ class OrionVault(OrionSmartContract):
     def pending_deposit(self, fulfill_batch_size: int | None = None) -> int:
         """Get total pending deposit amount across all users."""
         if fulfill_batch_size is None:
-            config = OrionConfig()
+            config = _get_config()
             fulfill_batch_size = config.max_fulfill_batch_size
         return _call_view(self.contract.functions.pendingDeposit(fulfill_batch_size))
 
     def pending_redeem(self, fulfill_batch_size: int | None = None) -> int:
         """Get total pending redemption shares across all users."""
         if fulfill_batch_size is None:
-            config = OrionConfig()
+            config = _get_config()
             fulfill_batch_size = config.max_fulfill_batch_size
         return _call_view(self.contract.functions.pendingRedeem(fulfill_batch_size))
 
@@ -593,33 +852,96 @@ class OrionVault(OrionSmartContract):
         Returns:
             TransactionResult with transaction hash, receipt, and decoded logs
         """
-        private_key = os.getenv(key_env)
-        validate_var(private_key, error_msg)
-        account = self.w3.eth.account.from_key(private_key)
-        nonce = self.w3.eth.get_transaction_count(account.address)
+        account = self._signer_account(key_env, error_msg)
+        tx = self._build_transaction(account, contract_fn_call, gas_limit)
+        return self._send_transaction(account, tx)
 
-        tx_params = {
-            "from": account.address,
-            "nonce": nonce,
-        }
-        if gas_limit is not None:
-            tx_params["gas"] = gas_limit
+    def execute_many(
+        self, contract_fn_calls, key_env: str = "MANAGER_PRIVATE_KEY"
+    ) -> list[TransactionResult]:
+        """Send several vault transactions from one signer back to back.
 
-        tx = contract_fn_call.build_transaction(tx_params)
-        signed = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-        receipt = self._wait_for_transaction_receipt(tx_hash.hex())
+        The nonce and gas estimates are read in one batch and the nonce is
+        incremented locally, so every transaction is broadcast before any
+        receipt is awaited. Gas is estimated per call against the current chain
+        state, so the calls must not depend on each other's effects; web3 fills
+        in the fee fields as for single transactions.
 
-        if receipt["status"] != 1:
-            raise Exception(f"Transaction failed with status: {receipt['status']}")
+        Args:
+            contract_fn_calls: Contract function calls, sent in order
+            key_env: Environment variable name for the private key (default: "MANAGER_PRIVATE_KEY")
 
-        decoded_logs = self._decode_logs(receipt)
+        Returns:
+            One TransactionResult per call, in the same order
 
-        return TransactionResult(
-            tx_hash=tx_hash.hex(),
-            receipt=receipt,
-            decoded_logs=decoded_logs,
-        )
+        Raises:
+            TransactionBatchError: If a transaction reverted, its receipt could
+                not be read, or broadcasting failed part-way. Every broadcast
+                transaction is awaited first, and the error carries their
+                hashes and results so the caller can tell which calls landed.
+        """
+        contract_fn_calls = list(contract_fn_calls)
+        account = self._signer_account(key_env)
+        with self.w3.batch_requests() as batch:
+            batch.add(self.w3.eth.get_transaction_count(account.address))
+            for contract_fn_call in contract_fn_calls:
+                batch.add(contract_fn_call.estimate_gas({"from": account.address}))
+            nonce, *estimates = batch.execute()
+
+        tx_hashes: list[str] = []
+        send_error = None
+        for offset, (contract_fn_call, estimate) in enumerate(
+            zip(contract_fn_calls, estimates)
+        ):
+            tx = {
+                "from": account.address,
+                "nonce": nonce + offset,
+                "gas": int(estimate * 1.2),
+                "chainId": self.chain_id,
+            }
+            try:
+                tx_hashes.append(
+                    self._submit_transaction(
+                        account, contract_fn_call.build_transaction(tx)
+                    )
+                )
+            except Exception as e:
+                if not tx_hashes:
+                    raise
+                # Earlier transactions are already out; report them below
+                send_error = e
+                break
+
+        # Wait for every hash even after a failure: their nonces are used anyway.
+        results: list[TransactionResult | None] = []
+        wait_error = None
+        for tx_hash in tx_hashes:
+            try:
+                results.append(self._transaction_result(tx_hash))
+            except (TimeExhausted, Web3RPCError) as e:
+                wait_error = wait_error or e
+                results.append(None)
+
+        failed = [
+            i
+            for i, res in enumerate(results)
+            if res is None or res.receipt["status"] != 1
+        ]
+        if send_error is not None:
+            raise TransactionBatchError(
+                f"Sending stopped after {len(tx_hashes)} of {len(contract_fn_calls)} "
+                f"transactions: {send_error}",
+                tx_hashes,
+                results,
+            ) from send_error
+        if failed:
+            raise TransactionBatchError(
+                f"{len(failed)} of {len(tx_hashes)} transactions failed "
+                f"(positions {failed}): {[tx_hashes[i] for i in failed]}",
+                tx_hashes,
+                results,
+            ) from wait_error
+        return results
 
     def request_deposit(self, assets: int) -> TransactionResult:
         """Submit an asynchronous deposit request."""
@@ -651,55 +973,30 @@ class OrionVault(OrionSmartContract):
 
     def update_strategist(self, new_strategist_address: str) -> TransactionResult:
         """Update the strategist address for the vault."""
-        config = OrionConfig()
+        config = _get_config()
         if not config.is_system_idle():
             raise SystemNotIdleError(
                 "System is not idle. Cannot update strategist at this time."
             )
 
-        manager_private_key = os.getenv("MANAGER_PRIVATE_KEY")
-        validate_var(
-            manager_private_key,
-            error_message=(
-                "MANAGER_PRIVATE_KEY environment variable is missing or invalid. "
-                "Please set MANAGER_PRIVATE_KEY in your .env file or as an environment variable. "
-                "Follow the SDK Installation instructions to get one: https://sdk.orionfinance.ai/"
-            ),
-        )
-
-        account = self.w3.eth.account.from_key(manager_private_key)
+        account = self._signer_account("MANAGER_PRIVATE_KEY")
         # Validate that the signer is the manager
         if account.address != self.manager_address:
             raise ValueError(
                 f"Signer {account.address} is not the vault manager {self.manager_address}. Cannot update strategist."
             )
 
-        nonce = self.w3.eth.get_transaction_count(account.address)
-
-        tx = self.contract.functions.updateStrategist(
-            new_strategist_address
-        ).build_transaction({"from": account.address, "nonce": nonce})
-
-        signed = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-        tx_hash_hex = tx_hash.hex()
-
-        receipt = self._wait_for_transaction_receipt(tx_hash_hex)
-
-        if receipt["status"] != 1:
-            raise Exception(f"Transaction failed with status: {receipt['status']}")
-
-        decoded_logs = self._decode_logs(receipt)
-
-        return TransactionResult(
-            tx_hash=tx_hash_hex, receipt=receipt, decoded_logs=decoded_logs
+        tx = self._build_transaction(
+            account, self.contract.functions.updateStrategist(new_strategist_address)
         )
 
+        return self._send_transaction(account, tx)
+
     def update_fee_model(
         self, fee_type: int, performance_fee: int, management_fee: int
     ) -> TransactionResult:
         """Update the fee model for the vault."""
-        config = OrionConfig()
+        config = _get_config()
         if not config.is_system_idle():
             raise SystemNotIdleError(
                 "System is not idle. Cannot update fee model at this time."
@@ -715,44 +1012,22 @@ class OrionVault(OrionSmartContract):
                 f"Management fee {management_fee} exceeds maximum {self.max_management_fee}"
             )
 
-        manager_private_key = os.getenv("MANAGER_PRIVATE_KEY")
-        validate_var(
-            manager_private_key,
-            error_message=(
-                "MANAGER_PRIVATE_KEY environment variable is missing or invalid. "
-                "Please set MANAGER_PRIVATE_KEY in your .env file or as an environment variable. "
-                "Follow the SDK Installation instructions to get one: https://sdk.orionfinance.ai/"
-            ),
-        )
-
-        account = self.w3.eth.account.from_key(manager_private_key)
+        account = self._signer_account("MANAGER_PRIVATE_KEY")
         # Validate that the signer is the manager
         if account.address != self.manager_address:
             raise ValueError(
                 f"Signer {account.address} is not the vault manager {self.manager_address}. Cannot update fee model."
             )
 
-        nonce = self.w3.eth.get_transaction_count(account.address)
-
-        tx = self.contract.functions.updateFeeModel(
-            fee_type, performance_fee, management_fee
-        ).build_transaction({"from": account.address, "nonce": nonce})
-
-        signed = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-        tx_hash_hex = tx_hash.hex()
-
-        receipt = self._wait_for_transaction_receipt(tx_hash_hex)
-
-        if receipt["status"] != 1:
-            raise Exception(f"Transaction failed with status: {receipt['status']}")
-
-        decoded_logs = self._decode_logs(receipt)
-
-        return TransactionResult(
-            tx_hash=tx_hash_hex, receipt=receipt, decoded_logs=decoded_logs
+        tx = self._build_transaction(
+            account,
+            self.contract.functions.updateFeeModel(
+                fee_type, performance_fee, management_fee
+            ),
         )
 
+        return self._send_transaction(account, tx)
+
     @property
     def total_assets(self) -> int:
         """Fetch the total assets of the vault."""
@@ -761,15 +1036,21 @@ class OrionVault(OrionSmartContract):
     @property
     def pending_vault_fees(self) -> float:
         """Fetch the pending vault fees in the underlying asset."""
-        config = OrionConfig()
+        config = _get_config()
         decimals = config.token_decimals(config.underlying_asset)
         return _call_view(self.contract.functions.pendingVaultFees()) / 10**decimals
 
     @property
     def share_price(self) -> int:
         """Fetch the current share price (value of 1 share unit)."""
-        decimals = _call_view(self.contract.functions.decimals())
-        return _call_view(self.contract.functions.convertToAssets(10**decimals))
+        return _call_view(
+            self.contract.functions.convertToAssets(10**self._share_decimals)
+        )
+
+    @cached_property
+    def _share_decimals(self) -> int:
+        """Decimals of the vault share token (immutable)."""
+        return _call_view(self.contract.functions.decimals())
 
     def convert_to_assets(self, shares: int) -> int:
         """Convert shares to assets."""
@@ -784,45 +1065,34 @@ class OrionVault(OrionSmartContract):
         self, access_control_address: str
     ) -> TransactionResult:
         """Set the deposit access control contract address."""
-        config = OrionConfig()
+        config = _get_config()
         if not config.is_system_idle():
             raise SystemNotIdleError(
                 "System is not idle. Cannot set deposit access control at this time."
             )
 
-        manager_private_key = os.getenv("MANAGER_PRIVATE_KEY")
-        validate_var(
-            manager_private_key,
-            error_message="MANAGER_PRIVATE_KEY environment variable is missing or invalid.",
+        account = self._signer_account(
+            "MANAGER_PRIVATE_KEY",
+            "MANAGER_PRIVATE_KEY environment variable is missing or invalid.",
         )
-        account = self.w3.eth.account.from_key(manager_private_key)
         # Validate that the signer is the manager
         if account.address != self.manager_address:
             raise ValueError(
                 f"Signer {account.address} is not the vault manager {self.manager_address}. Cannot set deposit access control."
             )
 
-        nonce = self.w3.eth.get_transaction_count(account.address)
-
-        tx = self.contract.functions.setDepositAccessControl(
-            Web3.to_checksum_address(access_control_address)
-        ).build_transaction({"from": account.address, "nonce": nonce})
-
-        signed = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-        tx_hash_hex = tx_hash.hex()
-        receipt = self._wait_for_transaction_receipt(tx_hash_hex)
-        return TransactionResult(
-            tx_hash=tx_hash_hex,
-            receipt=receipt,
-            decoded_logs=self._decode_logs(receipt),
+        tx = self._build_transaction(
+            account,
+            self.contract.functions.setDepositAccessControl(
+                _to_checksum(access_control_address)
+            ),
         )
 
+        return self._send_transaction(account, tx)
+
     def max_deposit(self, receiver: str) -> int:
         """Fetch the maximum deposit amount for a receiver."""
-        return _call_view(
-            self.contract.functions.maxDeposit(Web3.to_checksum_address(receiver))
-        )
+        return _call_view(self.contract.functions.maxDeposit(_to_checksum(receiver)))
 
     def can_request_deposit(self, user: str) -> bool:
         """Check if a user is allowed to request a deposit.
@@ -841,71 +1111,42 @@ class OrionVault(OrionSmartContract):
         if access_control_address == ZERO_ADDRESS:
             return True
 
-        # Minimal ABI for IOrionAccessControl to check permissions
-        access_control_abi = [
-            {
-                "inputs": [
-                    {"internalType": "address", "name": "sender", "type": "address"}
-                ],
-                "name": "canRequestDeposit",
-                "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
-                "stateMutability": "view",
-                "type": "function",
-            }
-        ]
-        access_control = self.w3.eth.contract(
-            address=access_control_address, abi=access_control_abi
-        )
+        access_control = _access_control_contract(self.w3, access_control_address)
         return _call_view(
-            access_control.functions.canRequestDeposit(Web3.to_checksum_address(user))
+            access_control.functions.canRequestDeposit(_to_checksum(user))
         )
 
 
 class OrionTransparentVault(OrionVault):
     """OrionTransparentVault contract."""
 
-    def __init__(self):
-        """Initialize the OrionTransparentVault contract."""
-        super().__init__("OrionTransparentVault")
+    def __init__(self, vault_address: str | None = None):
+        """Initialize the OrionTransparentVault contract (default address: ORION_VAULT_ADDRESS)."""
+        super().__init__("OrionTransparentVault", vault_address)
 
     def transfer_manager_fees(self, amount: int) -> TransactionResult:
         """Transfer manager fees (claimVaultFees)."""
-        config = OrionConfig()
+        config = _get_config()
         if not config.is_system_idle():
             raise SystemNotIdleError(
                 "System is not idle. Cannot transfer manager fees at this time."
             )
 
-        manager_private_key = os.getenv("MANAGER_PRIVATE_KEY")
-        validate_var(
-            manager_private_key,
-            error_message=(
-                "MANAGER_PRIVATE_KEY environment variable is missing or invalid. "
-                "Please set MANAGER_PRIVATE_KEY in your .env file or as an environment variable. "
-                "Follow the SDK Installation instructions to get one: https://sdk.orionfinance.ai/"
-            ),
-        )
-        account = self.w3.eth.account.from_key(manager_private_key)
+        account = self._signer_account("MANAGER_PRIVATE_KEY")
         # Validate that the signer is the manager
         if account.address != self.manager_address:
             raise ValueError(
                 f"Signer {account.address} is not the vault manager {self.manager_address}. Cannot claim fees."
             )
 
-        nonce = self.w3.eth.get_transaction_count(account.address)
-
-        tx = self.contract.functions.claimVaultFees(amount).build_transaction(
-            {"from": account.address, "nonce": nonce}
-        )
-        signed = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-        receipt = self._wait_for_transaction_receipt(tx_hash.hex())
-        return TransactionResult(
-            tx_hash=tx_hash.hex(),
-            receipt=receipt,
-            decoded_logs=self._decode_logs(receipt),
+        tx = self._build_transaction(
+            account,
+            self.contract.functions.claimVaultFees(amount),
+            legacy_gas_price=True,
         )
 
+        return self._send_transaction(account, tx)
+
     def submit_order_intent(
         self,
         order_intent: dict[str, int],
@@ -918,64 +1159,28 @@ class OrionTransparentVault(OrionVault):
         Returns:
             TransactionResult
         """
-        config = OrionConfig()
+        config = _get_config()
         if not config.is_system_idle():
             raise SystemNotIdleError(
                 "System is not idle. Cannot submit order intent at this time."
             )
 
-        strategist_private_key = os.getenv("STRATEGIST_PRIVATE_KEY")
-        validate_var(
-            strategist_private_key,
-            error_message=(
-                "STRATEGIST_PRIVATE_KEY environment variable is missing or invalid. "
-                "Please set STRATEGIST_PRIVATE_KEY in your .env file or as an environment variable. "
-                "Follow the SDK Installation instructions to get one: https://sdk.orionfinance.ai/"
-            ),
-        )
-
-        account = self.w3.eth.account.from_key(strategist_private_key)
-        # Validate that the signer is the strategist
-        if account.address != self.strategist_address:
+        account = self._signer_account("STRATEGIST_PRIVATE_KEY")
+        # Validate that the signer is the strategist (read live: the manager
+        # can replace the strategist at any time)
+        strategist_address = self.strategist_address
+        if account.address != strategist_address:
             raise ValueError(
-                f"Signer {account.address} is not the vault strategist {self.strategist_address}. Cannot submit order."
+                f"Signer {account.address} is not the vault strategist {strategist_address}. Cannot submit order."
             )
 
-        nonce = self.w3.eth.get_transaction_count(account.address)
-
         items = [
-            {"token": Web3.to_checksum_address(token), "weight": value}
+            {"token": _to_checksum(token), "weight": value}
             for token, value in order_intent.items()
         ]
 
-        # Estimate gas needed for the transaction
-        gas_estimate = self.contract.functions.submitIntent(items).estimate_gas(
-            {"from": account.address, "nonce": nonce}
+        tx = self._build_transaction(
+            account, self.contract.functions.submitIntent(items), legacy_gas_price=True
         )
 
-        # Add 20% buffer to gas estimate
-        gas_limit = int(gas_estimate * 1.2)
-
-        tx = self.contract.functions.submitIntent(items).build_transaction(
-            {
-                "from": account.address,
-                "nonce": nonce,
-                "gas": gas_limit,
-                "gasPrice": self.w3.eth.gas_price,
-            }
-        )
-
-        signed = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-        tx_hash_hex = tx_hash.hex()
-
-        receipt = self._wait_for_transaction_receipt(tx_hash_hex)
-
-        if receipt["status"] != 1:
-            raise Exception(f"Transaction failed with status: {receipt['status']}")
-
-        decoded_logs = self._decode_logs(receipt)
-
-        return TransactionResult(
-            tx_hash=tx_hash_hex, receipt=receipt, decoded_logs=decoded_logs
-        )
+        return self._send_transaction(account, tx)
@@ -21,7 +21,10 @@ class VaultType(str, Enum):
 
 
 class FeeType(str, Enum):
-    """Type of the fee."""
+    """Type of the fee.
+
+    Declaration order is the on-chain enum order; see fee_type_to_int.
+    """
 
     ABSOLUTE = "absolute"  #  Fee based on the latest return, no hurdles or high water mark (HWM)
     SOFT_HURDLE = "soft_hurdle"  # Fee unlocked after hurdle rate is reached
@@ -30,10 +33,5 @@ class FeeType(str, Enum):
     HURDLE_HWM = "hurdle_hwm"  # Combination of (hard) hurdle rate and HWM
 
 
-fee_type_to_int = {
-    "absolute": 0,
-    "soft_hurdle": 1,
-    "hard_hurdle": 2,
-    "high_water_mark": 3,
-    "hurdle_hwm": 4,
-}
+# Members are declared in the order of the on-chain FeeType enum
+fee_type_to_int = {fee_type.value: index for index, fee_type in enumerate(FeeType)}
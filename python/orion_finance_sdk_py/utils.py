@@ -76,9 +76,9 @@ def validate_management_fee(management_fee: int) -> None:
 
 def validate_order(order_intent: dict[str, int]) -> dict[str, int]:
     """Validate an order intent."""
-    from .contracts import OrionConfig
+    from .contracts import _get_config
 
-    orion_config = OrionConfig()
+    orion_config = _get_config()
 
     # Validate all tokens are whitelisted
     for token_address in order_intent.keys():
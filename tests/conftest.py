@@ -2,13 +2,26 @@
 
 import os
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
+import pytest
 from dotenv import load_dotenv
+from orion_finance_sdk_py.contracts import (
+    _access_control_contract,
+    _config_for,
+    _get_chain_id,
+    _get_web3,
+    _to_checksum,
+)
+from web3.contract import Contract
+from web3.datastructures import AttributeDict
 
-# Load .env from repo root, cwd, then tests/ (later files override so tests/.env can set ALCHEMY_API_KEY)
+# Load .env from repo root, cwd, then tests/ (later files override so tests/.env can set ALCHEMY_API_KEY).
+# dict.fromkeys drops repeats (pytest usually runs from the repo root) while keeping that order.
 _root = Path(__file__).resolve().parents[1]
-for _p in (_root / ".env", Path.cwd() / ".env", _root / "tests" / ".env"):
-    if _p.exists():
+_env_files = (_root / ".env", Path.cwd().resolve() / ".env", _root / "tests" / ".env")
+for _p in dict.fromkeys(_env_files):
+    if _p.is_file():
         load_dotenv(_p, override=True)
 
 # Fork tests use Hardhat node (16M gas cap); SDK view calls need explicit gas when forking
@@ -25,3 +38,108 @@ if os.getenv("GITHUB_ACTIONS") or os.getenv("CI"):
         return _original_start(self, timeout=timeout)
 
     _ape_providers.SubprocessProvider.start = _start_with_ci_timeout
+
+
+_SDK_CACHES = (
+    _config_for,
+    _get_web3,
+    _get_chain_id,
+    _access_control_contract,
+    _to_checksum,
+)
+
+
+def _clear_sdk_caches():
+    for cached in _SDK_CACHES:
+        cached.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_clients():
+    """Drop the SDK's shared clients and memoised lookups so mocks never leak between tests."""
+    _clear_sdk_caches()
+    yield
+    _clear_sdk_caches()
+
+
+@pytest.fixture
+def mock_w3():
+    """Mock Web3 instance."""
+    with patch("orion_finance_sdk_py.contracts.Web3") as MockWeb3:
+        # Mock the provider to avoid connection errors in init
+        MockWeb3.HTTPProvider.return_value = MagicMock()
+
+        # Setup the mock instance
+        w3_instance = MagicMock()
+        MockWeb3.return_value = w3_instance
+        # Mock chain ID
+        w3_instance.eth.chain_id = 11155111
+
+        # Mock eth.contract (specced so misspelt contract attributes fail loudly)
+        contract_mock = MagicMock(spec=Contract)
+        w3_instance.eth.contract.return_value = contract_mock
+
+        # Mock transaction signing and sending
+        w3_instance.eth.get_transaction_count.return_value = 0
+        w3_instance.eth.gas_price = 1000000000
+        w3_instance.eth.account.from_key.return_value = MagicMock(address="0xDeployer")
+
+        # Mock balance (default sufficient)
+        w3_instance.eth.get_balance.return_value = 10**18
+
+        signed_tx = MagicMock()
+        signed_tx.raw_transaction = b"raw_tx"
+        w3_instance.eth.account.from_key.return_value.sign_transaction.return_value = (
+            signed_tx
+        )
+
+        w3_instance.eth.send_raw_transaction.return_value = b"\x00" * 32
+
+        # Mock receipt (web3 returns an AttributeDict: key and attribute access)
+        receipt = AttributeDict(
+            {"status": 1, "transactionHash": b"\x00" * 32, "logs": []}
+        )
+
+        w3_instance.eth.wait_for_transaction_receipt.return_value = receipt
+
+        # Batched requests resolve to the values of the mocked calls added
+        batch = w3_instance.batch_requests.return_value.__enter__.return_value
+        batched = []
+        batch.add.side_effect = batched.append
+
+        def execute_batch():
+            results = list(batched)
+            batched.clear()
+            return results
+
+        batch.execute.side_effect = execute_batch
+
+        # Mock to_checksum_address to return the input string
+        MockWeb3.to_checksum_address.side_effect = lambda x: x
+
+        yield w3_instance
+
+
+@pytest.fixture
+def mock_load_abi():
+    """Mock load_contract_abi to avoid file I/O."""
+    with patch("orion_finance_sdk_py.contracts.load_contract_abi") as mock:
+        mock.return_value = [{"type": "function", "name": "test"}]
+        yield mock
+
+
+@pytest.fixture
+def mock_env():
+    """Mock environment variables."""
+    env_vars = {
+        "RPC_URL": "http://localhost:8545",
+        "CHAIN_ID": "11155111",
+        "STRATEGIST_ADDRESS": "0xStrategist",
+        "CURATOR_ADDRESS": "0xCurator",
+        "MANAGER_PRIVATE_KEY": "0xPrivate",
+        "STRATEGIST_PRIVATE_KEY": "0xPrivate",
+        "CURATOR_PRIVATE_KEY": "0xPrivate",
+        "ORION_VAULT_ADDRESS": "0xVault",
+    }
+    with patch.dict(os.environ, env_vars):
+        yield
@@ -64,7 +64,7 @@ def test_submit_order_transparent(
 ):
     """Test submitting transparent order."""
     mock_config = MockConfig.return_value
-    mock_config.orion_transparent_vaults = ["0xTransVault"]
+    mock_config.is_orion_vault.return_value = True
 
     mock_vault = MockVault.return_value
     mock_vault.submit_order_intent.return_value = MagicMock(decoded_logs=[])
@@ -89,7 +89,7 @@ def test_submit_order_transparent(
 def test_update_strategist(mock_ensure, MockConfig, MockVault):
     """Test update strategist."""
     mock_config = MockConfig.return_value
-    mock_config.orion_transparent_vaults = ["0xVault"]
+    mock_config.is_orion_vault.return_value = True
 
     mock_vault = MockVault.return_value
     mock_vault.update_strategist.return_value = MagicMock(decoded_logs=[])
@@ -110,7 +110,7 @@ def test_update_strategist(mock_ensure, MockConfig, MockVault):
 def test_update_fee_model(mock_ensure, MockConfig, MockVault):
     """Test update fee model."""
     mock_config = MockConfig.return_value
-    mock_config.orion_transparent_vaults = ["0xVault"]
+    mock_config.is_orion_vault.return_value = True
 
     mock_vault = MockVault.return_value
     mock_vault.update_fee_model.return_value = MagicMock(decoded_logs=[])
@@ -171,7 +171,7 @@ def test_deploy_vault_no_address(mock_ensure_env, MockVaultFactory):
 def test_submit_order_unknown_vault(mock_ensure_env, MockOrionConfig, tmp_path):
     """Test submit-order with unknown vault address."""
     mock_config = MockOrionConfig.return_value
-    mock_config.orion_transparent_vaults = ["0xTrans"]
+    mock_config.is_orion_vault.return_value = False
 
     # Create dummy order file
     order_file = tmp_path / "order.json"
@@ -187,6 +187,7 @@ def test_submit_order_unknown_vault(mock_ensure_env, MockOrionConfig, tmp_path):
     assert "Vault address 0xUnknown not in OrionConfig contract." in str(
         result.exception
     )
+    mock_config.is_orion_vault.assert_called_once_with("0xUnknown")
 
 
 @patch("orion_finance_sdk_py.cli.OrionTransparentVault")
@@ -195,7 +196,7 @@ def test_submit_order_unknown_vault(mock_ensure_env, MockOrionConfig, tmp_path):
 def test_get_pending_fees(mock_ensure, MockConfig, MockVault):
     """Test get-pending-fees command."""
     mock_config = MockConfig.return_value
-    mock_config.orion_transparent_vaults = ["0xVault"]
+    mock_config.is_orion_vault.return_value = True
 
     mock_vault = MockVault.return_value
     mock_vault.pending_vault_fees = 12345
@@ -227,7 +228,7 @@ def test_claim_fees_logic(mock_ensure, MockConfig, MockVault):
     from orion_finance_sdk_py.cli import _claim_fees_logic
 
     mock_config = MockConfig.return_value
-    mock_config.orion_transparent_vaults = ["0xVault"]
+    mock_config.is_orion_vault.return_value = True
 
     mock_vault = MockVault.return_value
     mock_vault.transfer_manager_fees.return_value = MagicMock(decoded_logs=[])
@@ -251,7 +252,7 @@ def test_update_dac_logic(mock_ensure, MockVault):
         # We need to mock OrionConfig for the vault type check in logic
         with patch("orion_finance_sdk_py.cli.OrionConfig") as MockConfig:
             mock_config = MockConfig.return_value
-            mock_config.orion_transparent_vaults = ["0xVault"]
+            mock_config.is_orion_vault.return_value = True
 
             _update_deposit_access_control_logic("0xNewDAC")
 
@@ -12,6 +12,23 @@ from orion_finance_sdk_py.cli import (
 from orion_finance_sdk_py.types import VaultType
 
 
+@pytest.fixture
+def questionary_answers(monkeypatch):
+    """Patch cli.questionary so every prompt's ask() returns the next queued answer."""
+
+    def _setup(answers):
+        iterator = iter(answers)
+        mock_questionary = MagicMock()
+        for prompt in ("select", "text", "path", "confirm"):
+            getattr(mock_questionary, prompt).return_value.ask.side_effect = lambda: (
+                next(iterator)
+            )
+        monkeypatch.setattr("orion_finance_sdk_py.cli.questionary", mock_questionary)
+        return mock_questionary
+
+    return _setup
+
+
 def test_ask_or_exit_success():
     """Test ask_or_exit returns value when user answers."""
     mock_question = MagicMock()
@@ -48,9 +65,10 @@ def test_validate_symbol():
 
 
 @patch("builtins.input")
-@patch("orion_finance_sdk_py.cli.questionary")
 @patch("orion_finance_sdk_py.cli._deploy_vault_logic")
-def test_interactive_menu_deploy_vault(mock_deploy_logic, mock_questionary, mock_input):
+def test_interactive_menu_deploy_vault(
+    mock_deploy_logic, mock_input, questionary_answers
+):
     """Test interactive menu Deploy Vault flow."""
     # Sequence of return values for ask() calls across all widgets
     ask_side_effect = [
@@ -65,14 +83,7 @@ def test_interactive_menu_deploy_vault(mock_deploy_logic, mock_questionary, mock
         "Exit",  # Main menu loop again
     ]
 
-    iterator = iter(ask_side_effect)
-
-    def next_answer():
-        return next(iterator)
-
-    # Configure the mock objects returned by questionary functions
-    mock_questionary.select.return_value.ask.side_effect = next_answer
-    mock_questionary.text.return_value.ask.side_effect = next_answer
+    questionary_answers(ask_side_effect)
 
     interactive_menu()
 
@@ -89,9 +100,10 @@ def test_interactive_menu_deploy_vault(mock_deploy_logic, mock_questionary, mock
 
 
 @patch("builtins.input")
-@patch("orion_finance_sdk_py.cli.questionary")
 @patch("orion_finance_sdk_py.cli._submit_order_logic")
-def test_interactive_menu_submit_order(mock_submit_logic, mock_questionary, mock_input):
+def test_interactive_menu_submit_order(
+    mock_submit_logic, mock_input, questionary_answers
+):
     """Test interactive menu Submit Order flow."""
     # Sequence:
     # 1. Main menu -> "Submit Order"
@@ -103,10 +115,7 @@ def test_interactive_menu_submit_order(mock_submit_logic, mock_questionary, mock
         "order.json",
         "Exit",
     ]
-    iterator = iter(ask_side_effect)
-
-    mock_questionary.select.return_value.ask.side_effect = lambda: next(iterator)
-    mock_questionary.path.return_value.ask.side_effect = lambda: next(iterator)
+    questionary_answers(ask_side_effect)
 
     interactive_menu()
 
@@ -114,10 +123,9 @@ def test_interactive_menu_submit_order(mock_submit_logic, mock_questionary, mock
 
 
 @patch("builtins.input")
-@patch("orion_finance_sdk_py.cli.questionary")
 @patch("orion_finance_sdk_py.cli._update_strategist_logic")
 def test_interactive_menu_update_strategist(
-    mock_update_logic, mock_questionary, mock_input
+    mock_update_logic, mock_input, questionary_answers
 ):
     """Test interactive menu Update Strategist flow."""
     # Sequence:
@@ -130,10 +138,7 @@ def test_interactive_menu_update_strategist(
         "0xNew",
         "Exit",
     ]
-    iterator = iter(ask_side_effect)
-
-    mock_questionary.select.return_value.ask.side_effect = lambda: next(iterator)
-    mock_questionary.text.return_value.ask.side_effect = lambda: next(iterator)
+    questionary_answers(ask_side_effect)
 
     interactive_menu()
 
@@ -141,10 +146,9 @@ def test_interactive_menu_update_strategist(
 
 
 @patch("builtins.input")
-@patch("orion_finance_sdk_py.cli.questionary")
 @patch("orion_finance_sdk_py.cli._update_fee_model_logic")
 def test_interactive_menu_update_fee_model(
-    mock_fee_logic, mock_questionary, mock_input
+    mock_fee_logic, mock_input, questionary_answers
 ):
     """Test interactive menu Update Fee Model flow."""
     # Sequence:
@@ -161,10 +165,7 @@ def test_interactive_menu_update_fee_model(
         "1",
         "Exit",
     ]
-    iterator = iter(ask_side_effect)
-
-    mock_questionary.select.return_value.ask.side_effect = lambda: next(iterator)
-    mock_questionary.text.return_value.ask.side_effect = lambda: next(iterator)
+    questionary_answers(ask_side_effect)
 
     interactive_menu()
 
@@ -176,22 +177,14 @@ def test_interactive_menu_update_fee_model(
 
 
 @patch("builtins.input")
-@patch("orion_finance_sdk_py.cli.questionary")
-def test_interactive_menu_cancel(mock_questionary, mock_input):
+def test_interactive_menu_cancel(mock_input, questionary_answers):
     """Test interactive menu handles KeyboardInterrupt gracefully."""
     ask_side_effect = [
         "Deploy Vault",
         None,  # Simulates Ctrl+C inside Name prompt
         "Exit",
     ]
-    iterator = iter(ask_side_effect)
-
-    def next_answer():
-        val = next(iterator)
-        return val
-
-    mock_questionary.select.return_value.ask.side_effect = next_answer
-    mock_questionary.text.return_value.ask.side_effect = next_answer
+    mock_questionary = questionary_answers(ask_side_effect)
 
     interactive_menu()
 
@@ -199,19 +192,15 @@ def test_interactive_menu_cancel(mock_questionary, mock_input):
 
 
 @patch("builtins.input")
-@patch("orion_finance_sdk_py.cli.questionary")
 @patch("orion_finance_sdk_py.cli._update_deposit_access_control_logic")
-def test_interactive_menu_update_dac(mock_dac_logic, mock_questionary, mock_input):
+def test_interactive_menu_update_dac(mock_dac_logic, mock_input, questionary_answers):
     """Test interactive menu Update DAC flow."""
     ask_side_effect = [
         "Update Deposit Access Control",
         "0xDAC",
         "Exit",
     ]
-    iterator = iter(ask_side_effect)
-
-    mock_questionary.select.return_value.ask.side_effect = lambda: next(iterator)
-    mock_questionary.text.return_value.ask.side_effect = lambda: next(iterator)
+    questionary_answers(ask_side_effect)
 
     interactive_menu()
 
@@ -219,19 +208,15 @@ def test_interactive_menu_update_dac(mock_dac_logic, mock_questionary, mock_inpu
 
 
 @patch("builtins.input")
-@patch("orion_finance_sdk_py.cli.questionary")
 @patch("orion_finance_sdk_py.cli._claim_fees_logic")
-def test_interactive_menu_claim_fees(mock_claim_logic, mock_questionary, mock_input):
+def test_interactive_menu_claim_fees(mock_claim_logic, mock_input, questionary_answers):
     """Test interactive menu Claim Fees flow."""
     ask_side_effect = [
         "Claim Fees",
         "100",
         "Exit",
     ]
-    iterator = iter(ask_side_effect)
-
-    mock_questionary.select.return_value.ask.side_effect = lambda: next(iterator)
-    mock_questionary.text.return_value.ask.side_effect = lambda: next(iterator)
+    questionary_answers(ask_side_effect)
 
     interactive_menu()
 
@@ -239,19 +224,16 @@ def test_interactive_menu_claim_fees(mock_claim_logic, mock_questionary, mock_in
 
 
 @patch("builtins.input")
-@patch("orion_finance_sdk_py.cli.questionary")
 @patch("orion_finance_sdk_py.cli._get_pending_fees_logic")
 def test_interactive_menu_get_pending_fees(
-    mock_pending_logic, mock_questionary, mock_input
+    mock_pending_logic, mock_input, questionary_answers
 ):
     """Test interactive menu Get Pending Fees flow."""
     ask_side_effect = [
         "Get Pending Fees",
         "Exit",
     ]
-    iterator = iter(ask_side_effect)
-
-    mock_questionary.select.return_value.ask.side_effect = lambda: next(iterator)
+    questionary_answers(ask_side_effect)
 
     interactive_menu()
 
@@ -259,10 +241,9 @@ def test_interactive_menu_get_pending_fees(
 
 
 @patch("builtins.input")
-@patch("orion_finance_sdk_py.cli.questionary")
 @patch("orion_finance_sdk_py.cli._deploy_vault_logic")
 def test_interactive_menu_error_handling(
-    mock_deploy_logic, mock_questionary, mock_input
+    mock_deploy_logic, mock_input, questionary_answers
 ):
     """Test interactive menu handles errors gracefully."""
     mock_deploy_logic.side_effect = ValueError("Test Error")
@@ -278,13 +259,7 @@ def test_interactive_menu_error_handling(
         "0x0",
         "Exit",
     ]
-    iterator = iter(ask_side_effect)
-
-    def next_answer():
-        return next(iterator)
-
-    mock_questionary.select.return_value.ask.side_effect = next_answer
-    mock_questionary.text.return_value.ask.side_effect = next_answer
+    questionary_answers(ask_side_effect)
 
     interactive_menu()
 
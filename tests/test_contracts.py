@@ -2,9 +2,12 @@
 
 import json
 import os
-from unittest.mock import MagicMock, patch
+import sys
+from io import StringIO
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
+from eth_utils import event_abi_to_log_topic
 from orion_finance_sdk_py.contracts import (
     LiquidityOrchestrator,
     OrionConfig,
@@ -12,86 +15,41 @@ from orion_finance_sdk_py.contracts import (
     OrionTransparentVault,
     OrionVault,
     SystemNotIdleError,
+    TransactionBatchError,
     TransactionResult,
     VaultFactory,
+    _get_config,
     _get_view_call_tx,
     load_contract_abi,
 )
 from orion_finance_sdk_py.types import ZERO_ADDRESS, VaultType
+from web3.datastructures import AttributeDict
+from web3.exceptions import MismatchedABI, Web3RPCError
+
+_TEST_ABI = [{"type": "function", "name": "test"}]
+_TEST_ABI_JSON = json.dumps({"abi": _TEST_ABI})
+_TEST_EVENT_ABI = {"type": "event", "name": "TestEvent", "inputs": []}
+# (contract function, OrionConfig property, mocked value)
+_V2_CONFIG_PROPERTIES = (
+    ("minDepositAmount", "min_deposit_amount", 100),
+    ("minRedeemAmount", "min_redeem_amount", 50),
+    ("vFeeCoefficient", "v_fee_coefficient", 5),
+    ("rsFeeCoefficient", "rs_fee_coefficient", 10),
+    ("feeChangeCooldownDuration", "fee_change_cooldown_duration", 86400),
+    ("maxFulfillBatchSize", "max_fulfill_batch_size", 50),
+    ("getAllWhitelistedAssetNames", "whitelisted_asset_names", ["USDC", "WETH"]),
+)
 
 
 @pytest.fixture
-def mock_w3():
-    """Mock Web3 instance."""
-    with patch("orion_finance_sdk_py.contracts.Web3") as MockWeb3:
-        # Mock the provider to avoid connection errors in init
-        MockWeb3.HTTPProvider.return_value = MagicMock()
-
-        # Setup the mock instance
-        w3_instance = MagicMock()
-        MockWeb3.return_value = w3_instance
-        # Mock chain ID
-        w3_instance.eth.chain_id = 11155111
-
-        # Mock eth.contract
-        contract_mock = MagicMock()
-        w3_instance.eth.contract.return_value = contract_mock
-
-        # Mock transaction signing and sending
-        w3_instance.eth.get_transaction_count.return_value = 0
-        w3_instance.eth.gas_price = 1000000000
-        w3_instance.eth.account.from_key.return_value = MagicMock(address="0xDeployer")
-
-        # Mock balance (default sufficient)
-        w3_instance.eth.get_balance.return_value = 10**18
-
-        signed_tx = MagicMock()
-        signed_tx.raw_transaction = b"raw_tx"
-        w3_instance.eth.account.from_key.return_value.sign_transaction.return_value = (
-            signed_tx
-        )
-
-        w3_instance.eth.send_raw_transaction.return_value = b"\x00" * 32
-
-        # Mock receipt
-        receipt = MagicMock()
-        receipt.status = 1
-        receipt.transactionHash = b"\x00" * 32
-        receipt.logs = []
-        # Support dict access too
-        receipt.__getitem__ = lambda self, key: getattr(self, key)
-
-        w3_instance.eth.wait_for_transaction_receipt.return_value = receipt
-
-        # Mock to_checksum_address to return the input string
-        MockWeb3.to_checksum_address.side_effect = lambda x: x
-
-        yield w3_instance
-
-
-@pytest.fixture
-def mock_load_abi():
-    """Mock load_contract_abi to avoid file I/O."""
-    with patch("orion_finance_sdk_py.contracts.load_contract_abi") as mock:
-        mock.return_value = [{"type": "function", "name": "test"}]
-        yield mock
-
-
-@pytest.fixture
-def mock_env():
-    """Mock environment variables."""
-    env_vars = {
-        "RPC_URL": "http://localhost:8545",
-        "CHAIN_ID": "11155111",
-        "STRATEGIST_ADDRESS": "0xStrategist",
-        "CURATOR_ADDRESS": "0xCurator",
-        "MANAGER_PRIVATE_KEY": "0xPrivate",
-        "STRATEGIST_PRIVATE_KEY": "0xPrivate",
-        "CURATOR_PRIVATE_KEY": "0xPrivate",
-        "ORION_VAULT_ADDRESS": "0xVault",
-    }
-    with patch.dict(os.environ, env_vars):
-        yield
+def transparent_vault(mock_w3, mock_load_abi, mock_env):
+    """OrionTransparentVault backed by an idle, patched OrionConfig; yields (vault, config)."""
+    with patch("orion_finance_sdk_py.contracts.OrionConfig") as MockConfig:
+        config_instance = MockConfig.return_value
+        config_instance.is_orion_vault.return_value = True
+        config_instance.is_system_idle.return_value = True
+        config_instance.max_fulfill_batch_size = 10
+        yield OrionTransparentVault(), config_instance
 
 
 class TestLoadContractAbi:
@@ -103,21 +61,32 @@ class TestLoadContractAbi:
         assert isinstance(abi, list)
         assert len(abi) > 0
 
-    def test_load_contract_abi_fallback(self):
-        """Load ABI from local path when package resources fail."""
+    def test_load_contract_abi_fallback(self, tmp_path):
+        """Load ABI from local path when package resources are missing."""
+        load_contract_abi.cache_clear()
+        (tmp_path / "OrionConfig.json").write_text(_TEST_ABI_JSON)
+        with (
+            patch("orion_finance_sdk_py.contracts.resources.files") as mock_files,
+            patch("orion_finance_sdk_py.contracts._DEV_ABI_DIR", tmp_path),
+        ):
+            mock_files.return_value.joinpath.return_value.is_file.return_value = False
+            abi = load_contract_abi("OrionConfig")
+            assert abi == _TEST_ABI
+        load_contract_abi.cache_clear()
+
+    def test_load_contract_abi_cached(self):
+        """Repeated loads of the same ABI parse the file only once."""
+        load_contract_abi.cache_clear()
         with patch("orion_finance_sdk_py.contracts.resources.files") as mock_files:
-            mock_files.return_value.joinpath.return_value.open.side_effect = (
-                FileNotFoundError
+            mock_files.return_value.joinpath.return_value.open.return_value = StringIO(
+                _TEST_ABI_JSON
             )
-            mock_f = MagicMock()
-            mock_f.read.return_value = json.dumps(
-                {"abi": [{"type": "function", "name": "test"}]}
-            )
-            mock_f.__enter__.return_value = mock_f
-            mock_f.__exit__.return_value = None
-            with patch("builtins.open", return_value=mock_f):
-                abi = load_contract_abi("OrionConfig")
-                assert abi == [{"type": "function", "name": "test"}]
+            first = load_contract_abi("OrionConfig")
+            second = load_contract_abi("OrionConfig")
+        load_contract_abi.cache_clear()
+
+        assert first is second
+        mock_files.assert_called_once()
 
     def test_get_view_call_tx_without_env(self):
         """_get_view_call_tx returns empty dict when ORION_FORCE_VIEW_GAS not set."""
@@ -142,6 +111,34 @@ class TestOrionSmartContract:
         assert contract.contract_name == "TestContract"
         assert contract.contract_address == "0xAddress"
 
+    @pytest.mark.usefixtures("mock_load_abi", "mock_env")
+    def test_chain_id_read_once(self, mock_w3):
+        """Contracts on the same RPC URL share one eth_chainId lookup."""
+        chain_id = PropertyMock(return_value=11155111)
+        type(mock_w3.eth).chain_id = chain_id
+
+        first = OrionSmartContract("TestContract", "0xAddress")
+        second = OrionSmartContract("TestContract", "0xOther")
+
+        assert first.chain_id == second.chain_id == 11155111
+        chain_id.assert_called_once()
+
+    @pytest.mark.usefixtures("mock_load_abi", "mock_env")
+    def test_signer_account_cached(self, mock_w3, monkeypatch):
+        """Signer accounts are derived once per instance until the key changes."""
+        contract = OrionSmartContract("TestContract", "0xAddress")
+        first = contract._signer_account("MANAGER_PRIVATE_KEY")
+        assert contract._signer_account("MANAGER_PRIVATE_KEY") is first
+        mock_w3.eth.account.from_key.assert_called_once_with("0xPrivate")
+
+        monkeypatch.setenv("MANAGER_PRIVATE_KEY", "0xRotated")
+        contract._signer_account("MANAGER_PRIVATE_KEY")
+        mock_w3.eth.account.from_key.assert_called_with("0xRotated")
+
+        other = OrionSmartContract("TestContract", "0xOther")
+        other._signer_account("MANAGER_PRIVATE_KEY")
+        assert mock_w3.eth.account.from_key.call_count == 3
+
     @pytest.mark.usefixtures("mock_load_abi", "mock_env")
     def test_wait_for_transaction_receipt(self, mock_w3):
         """Test waiting for receipt."""
@@ -157,27 +154,38 @@ class TestOrionSmartContract:
         contract = OrionSmartContract("TestContract", "0xAddress")
 
         # Setup event mock
+        # Receipt-level hashes are shared by every log, so each is hex-encoded once
+        block_hash = MagicMock()
+        block_hash.hex.return_value = "0xblock"
+        tx_hash = MagicMock()
+        tx_hash.hex.return_value = "0xtx"
         event_mock = MagicMock()
         event_mock.process_log.return_value = MagicMock(
             event="TestEvent",
             args={"arg1": 1},
             address="0xAddress",
-            blockHash=b"hash",
+            blockHash=block_hash,
             blockNumber=1,
             logIndex=0,
-            transactionHash=b"txhash",
+            transactionHash=tx_hash,
             transactionIndex=0,
         )
+        event_mock.abi = _TEST_EVENT_ABI
         contract.contract.events = [event_mock]
 
         receipt = MagicMock()
         log_mock = MagicMock()
         log_mock.address = "0xAddress"  # Matching address
-        receipt.logs = [log_mock]
+        log_mock.topics = [event_abi_to_log_topic(_TEST_EVENT_ABI)]
+        receipt.logs = [log_mock, log_mock]
 
         logs = contract._decode_logs(receipt)
-        assert len(logs) == 1
+        assert len(logs) == 2
         assert logs[0]["event"] == "TestEvent"
+        assert logs[1]["blockHash"] == "0xblock"
+        assert logs[1]["transactionHash"] == "0xtx"
+        block_hash.hex.assert_called_once()
+        tx_hash.hex.assert_called_once()
 
         # Test ignoring logs from other contracts
         log_mock_other = MagicMock()
@@ -186,6 +194,24 @@ class TestOrionSmartContract:
         logs = contract._decode_logs(receipt)
         assert len(logs) == 0
 
+    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
+    def test_decode_logs_skips_undecodable(self):
+        """A log whose topic matches but whose data does not decode is skipped."""
+        contract = OrionSmartContract("TestContract", "0xAddress")
+        event_mock = MagicMock()
+        event_mock.abi = _TEST_EVENT_ABI
+        event_mock.process_log.side_effect = MismatchedABI("stale ABI")
+        contract.contract.events = [event_mock]
+
+        log_mock = MagicMock()
+        log_mock.address = "0xAddress"
+        log_mock.topics = [event_abi_to_log_topic(_TEST_EVENT_ABI)]
+        receipt = MagicMock()
+        receipt.logs = [log_mock]
+
+        assert contract._decode_logs(receipt) == []
+        event_mock.process_log.assert_called_once_with(log_mock)
+
 
 class TestOrionConfig:
     """Tests for OrionConfig."""
@@ -233,90 +259,147 @@ class TestOrionConfig:
         assert config.is_whitelisted_manager("0xManager") is True
 
     @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_v2_properties(self):
-        """Test v2.0.0 OrionConfig properties."""
+    def test_token_decimals_cached(self):
+        """Token decimals are fetched once per token."""
         config = OrionConfig()
+        get_decimals = config.contract.functions.getTokenDecimals
+        get_decimals.return_value.call.return_value = 6
+
+        assert config.token_decimals("0xUSDC") == 6
+        assert config.token_decimals("0xUSDC") == 6
+        get_decimals.assert_called_once_with("0xUSDC")
 
-        config.contract.functions.minDepositAmount().call.return_value = 100
-        assert config.min_deposit_amount == 100
+    @pytest.mark.usefixtures("mock_load_abi", "mock_env")
+    def test_snapshot(self, mock_w3):
+        """snapshot() reads every parameter in a single batch."""
+        config = OrionConfig()
+        functions = config.contract.functions
+        functions.underlyingAsset.return_value.call.return_value = "0xUSDC"
+        functions.strategistIntentDecimals.return_value.call.return_value = 18
+        functions.riskFreeRate.return_value.call.return_value = 500
+        functions.maxFulfillBatchSize.return_value.call.return_value = 50
+        batch = mock_w3.batch_requests.return_value.__enter__.return_value
+
+        snapshot = config.snapshot()
+
+        mock_w3.batch_requests.assert_called_once()
+        assert batch.add.call_count == 9
+        batch.execute.assert_called_once()
+        assert snapshot.underlying_asset == "0xUSDC"
+        assert snapshot.strategist_intent_decimals == 18
+        assert snapshot.risk_free_rate == 500
+        assert snapshot.max_fulfill_batch_size == 50
 
-        config.contract.functions.minRedeemAmount().call.return_value = 50
-        assert config.min_redeem_amount == 50
+    @pytest.mark.usefixtures("mock_load_abi", "mock_env")
+    def test_are_orion_vaults(self, mock_w3):
+        """are_orion_vaults() checks every address in a single batch."""
+        config = OrionConfig()
+        config.contract.functions.isOrionVault.return_value.call.side_effect = [
+            True,
+            False,
+        ]
 
-        config.contract.functions.vFeeCoefficient().call.return_value = 5
-        assert config.v_fee_coefficient == 5
+        assert config.are_orion_vaults(["0xVault", "0xOther"]) == [True, False]
+        mock_w3.batch_requests.assert_called_once()
+        assert config.are_orion_vaults([]) == []
+        mock_w3.batch_requests.assert_called_once()
 
-        config.contract.functions.rsFeeCoefficient().call.return_value = 10
-        assert config.rs_fee_coefficient == 10
+    @pytest.mark.parametrize(("fn_name", "prop", "value"), _V2_CONFIG_PROPERTIES)
+    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
+    def test_v2_properties(self, fn_name, prop, value):
+        """Test v2.0.0 OrionConfig properties."""
+        config = OrionConfig()
 
-        config.contract.functions.feeChangeCooldownDuration().call.return_value = 86400
-        assert config.fee_change_cooldown_duration == 86400
+        getattr(
+            config.contract.functions, fn_name
+        ).return_value.call.return_value = value
+        assert getattr(config, prop) == value
 
-        config.contract.functions.maxFulfillBatchSize().call.return_value = 50
-        assert config.max_fulfill_batch_size == 50
+    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
+    def test_shared_config(self, mock_w3):
+        """_get_config reuses one OrionConfig (and Web3) per environment."""
+        config = _get_config()
+        assert _get_config() is config
+        assert OrionSmartContract("Test", "0xAddress").w3 is config.w3
+
+        with patch.dict(os.environ, {"ORION_CONFIG_ADDRESS": "0xOtherConfig"}):
+            other = _get_config()
+        assert other is not config
+        assert other.contract_address == "0xOtherConfig"
+
+    @pytest.mark.usefixtures("mock_load_abi")
+    def test_config_follows_ape_provider(self, monkeypatch):
+        """Without RPC_URL, _get_config binds to the ape provider active at each call."""
+        monkeypatch.delenv("RPC_URL", raising=False)
+        monkeypatch.setattr(
+            "orion_finance_sdk_py.contracts._load_cwd_dotenv", lambda: None
+        )
+        fake_ape = MagicMock()
+        monkeypatch.setitem(sys.modules, "ape", fake_ape)
 
-        config.contract.functions.getAllWhitelistedAssetNames().call.return_value = [
-            "USDC",
-            "WETH",
-        ]
-        assert config.whitelisted_asset_names == ["USDC", "WETH"]
+        first_provider, second_provider = MagicMock(), MagicMock()
+        fake_ape.networks.active_provider = first_provider
+        first = _get_config()
+        fake_ape.networks.active_provider = second_provider
+        second = _get_config()
+
+        assert first.w3 is first_provider.web3
+        assert second.w3 is second_provider.web3
 
     @pytest.mark.usefixtures("mock_w3", "mock_load_abi")
-    def test_init_invalid_chain(self):
+    def test_init_invalid_chain(self, monkeypatch):
         """Test init with invalid chain ID (chain 1 not in CHAIN_CONFIG)."""
         # Force address from CHAIN_ID so we hit the "unsupported chain" path
-        with patch.dict(
-            os.environ,
-            {
-                "CHAIN_ID": "1",
-                "RPC_URL": "http://localhost",
-                "ORION_CONFIG_ADDRESS": "",  # unset so OrionConfig uses CHAIN_ID
-            },
-            clear=False,
-        ):
-            with pytest.raises(ValueError, match="Unsupported CHAIN_ID"):
-                OrionConfig()
+        monkeypatch.setenv("CHAIN_ID", "1")
+        monkeypatch.setenv("RPC_URL", "http://localhost")
+        monkeypatch.setenv(
+            "ORION_CONFIG_ADDRESS", ""
+        )  # unset so OrionConfig uses CHAIN_ID
+        with pytest.raises(ValueError, match="Unsupported CHAIN_ID"):
+            OrionConfig()
 
     @pytest.mark.usefixtures("mock_w3", "mock_load_abi")
-    def test_init_chain_mismatch(self):
+    def test_init_chain_mismatch(self, monkeypatch, capsys):
         """Test init with chain ID mismatch warning."""
         # mock_w3 provides chain_id=11155111
-        with patch.dict(os.environ, {"CHAIN_ID": "1", "RPC_URL": "http://localhost"}):
-            with patch("builtins.print") as mock_print:
-                # We instantiate a base contract which does the check
-                OrionSmartContract("Test", "0xAddress")
-                mock_print.assert_called_with(
-                    "⚠️ Warning: CHAIN_ID in env (1) does not match RPC chain ID (11155111)"
-                )
+        monkeypatch.setenv("CHAIN_ID", "1")
+        monkeypatch.setenv("RPC_URL", "http://localhost")
+        # We instantiate a base contract which does the check
+        OrionSmartContract("Test", "0xAddress")
+        assert (
+            "⚠️ Warning: CHAIN_ID in env (1) does not match RPC chain ID (11155111)"
+            in capsys.readouterr().out
+        )
 
     @pytest.mark.usefixtures("mock_w3", "mock_load_abi")
-    def test_init_invalid_chain_id_env(self):
+    def test_init_invalid_chain_id_env(self, monkeypatch, capsys):
         """Test init with non-integer CHAIN_ID in env prints warning."""
-        with patch.dict(
-            os.environ, {"CHAIN_ID": "invalid", "RPC_URL": "http://localhost"}
-        ):
-            with patch("builtins.print") as mock_print:
-                OrionSmartContract("Test", "0xAddress")
-                mock_print.assert_called_with(
-                    "⚠️ Warning: Invalid CHAIN_ID in env: invalid"
-                )
+        monkeypatch.setenv("CHAIN_ID", "invalid")
+        monkeypatch.setenv("RPC_URL", "http://localhost")
+        OrionSmartContract("Test", "0xAddress")
+        assert "⚠️ Warning: Invalid CHAIN_ID in env: invalid" in capsys.readouterr().out
 
     @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_decode_logs_exception(self):
-        """Test decoding logs with exception."""
+    def test_decode_logs_unknown_topic(self):
+        """Logs whose topic matches no contract event are skipped."""
         contract = OrionSmartContract("TestContract", "0xAddress")
 
         event_mock = MagicMock()
-        event_mock.process_log.side_effect = Exception("Decode error")
+        event_mock.abi = _TEST_EVENT_ABI
         contract.contract.events = [event_mock]
 
         receipt = MagicMock()
         log_mock = MagicMock()
         log_mock.address = "0xAddress"
-        receipt.logs = [log_mock]
+        log_mock.topics = [b"\x00" * 32]
+        anonymous_log = MagicMock()
+        anonymous_log.address = "0xAddress"
+        anonymous_log.topics = []
+        receipt.logs = [log_mock, anonymous_log]
 
         logs = contract._decode_logs(receipt)
         assert len(logs) == 0
+        event_mock.process_log.assert_not_called()
 
 
 class TestLiquidityOrchestrator:
@@ -340,27 +423,30 @@ class TestLiquidityOrchestrator:
         assert lo.epoch_duration == 3600
 
 
-class TestVaultFactory:
-    """Tests for VaultFactory."""
-
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_create_orion_vault(self, MockConfig):
-        """Test vault creation."""
-        # Mock OrionConfig
+@pytest.fixture
+def vault_factory(mock_w3, mock_load_abi, mock_env):
+    """Transparent VaultFactory whose patched OrionConfig allows vault creation; yields (factory, config)."""
+    with patch("orion_finance_sdk_py.contracts.OrionConfig") as MockConfig:
         config_instance = MockConfig.return_value
         config_instance.is_system_idle.return_value = True
-        config_instance.is_whitelisted_manager.return_value = True  # Whitelisted
+        config_instance.is_whitelisted_manager.return_value = True
         config_instance.contract.functions.transparentVaultFactory().call.return_value = "0xTVF"
         config_instance.max_performance_fee = 3000
         config_instance.max_management_fee = 300
 
         factory = VaultFactory(VaultType.TRANSPARENT)
-        assert factory.contract_address == "0xTVF"
-
-        # Mock contract calls
         factory.contract.functions.createVault.return_value.estimate_gas.return_value = 100000
         factory.contract.functions.createVault.return_value.build_transaction.return_value = {}
+        yield factory, config_instance
+
+
+class TestVaultFactory:
+    """Tests for VaultFactory."""
+
+    def test_create_orion_vault(self, vault_factory):
+        """Test vault creation."""
+        factory, _ = vault_factory
+        assert factory.contract_address == "0xTVF"
 
         result = factory.create_orion_vault(
             name="Test",
@@ -376,41 +462,24 @@ class TestVaultFactory:
         assert result.receipt["status"] == 1
 
         # Verify call arguments (checking if strategist address from env is used)
-        factory.contract.functions.createVault.assert_called()
+        factory.contract.functions.createVault.assert_called_once()
         args = factory.contract.functions.createVault.call_args[0]
         assert args[0] == "0xStrategist"  # First arg is strategist
 
         # Check deposit access control passed
         assert args[6] == ZERO_ADDRESS
 
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_load_abi", "mock_env")
-    def test_create_orion_vault_manager_not_whitelisted(self, MockConfig, mock_w3):
+    def test_create_orion_vault_manager_not_whitelisted(self, vault_factory):
         """Test vault creation fails when manager is not whitelisted."""
-        config_instance = MockConfig.return_value
-        config_instance.is_system_idle.return_value = True
+        factory, config_instance = vault_factory
         config_instance.is_whitelisted_manager.return_value = False  # Not whitelisted
-        config_instance.contract.functions.transparentVaultFactory().call.return_value = "0xTVF"
-
-        factory = VaultFactory(VaultType.TRANSPARENT)
 
         with pytest.raises(ValueError, match="is not whitelisted to create vaults"):
             factory.create_orion_vault("0xStrategist", "N", "S", 0, 0, 0)
 
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_load_abi", "mock_env")
-    def test_create_orion_vault_insufficient_balance(self, MockConfig, mock_w3):
+    def test_create_orion_vault_insufficient_balance(self, vault_factory, mock_w3):
         """Test vault creation fails with insufficient balance."""
-        config_instance = MockConfig.return_value
-        config_instance.is_system_idle.return_value = True
-        config_instance.is_whitelisted_manager.return_value = True
-        config_instance.contract.functions.transparentVaultFactory().call.return_value = "0xTVF"
-        config_instance.max_performance_fee = 3000
-        config_instance.max_management_fee = 300
-
-        factory = VaultFactory(VaultType.TRANSPARENT)
-
-        factory.contract.functions.createVault.return_value.estimate_gas.return_value = 100000
+        factory, _ = vault_factory
         mock_w3.eth.gas_price = 1000000000
         # Cost ~ 1.2 * 10^14
         mock_w3.eth.get_balance.return_value = 0  # Not enough
@@ -418,21 +487,13 @@ class TestVaultFactory:
         with pytest.raises(ValueError, match="Insufficient ETH balance"):
             factory.create_orion_vault("0xStrategist", "N", "S", 0, 0, 0)
 
-    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_create_orion_vault_system_busy(self):
+    def test_create_orion_vault_system_busy(self, vault_factory):
         """Test system busy check."""
-        with patch("orion_finance_sdk_py.contracts.OrionConfig") as MockConfig:
-            MockConfig.return_value.is_system_idle.return_value = False
-            MockConfig.return_value.is_whitelisted_manager.return_value = True
-            # Mock transparent factory address
-            MockConfig.return_value.contract.functions.transparentVaultFactory().call.return_value = "0xTVF"
-            MockConfig.return_value.max_performance_fee = 3000
-            MockConfig.return_value.max_management_fee = 300
-
-            factory = VaultFactory(VaultType.TRANSPARENT)
+        factory, config_instance = vault_factory
+        config_instance.is_system_idle.return_value = False
 
-            with pytest.raises(SystemNotIdleError):
-                factory.create_orion_vault("0xStrategist", "N", "S", 0, 0, 0)
+        with pytest.raises(SystemNotIdleError):
+            factory.create_orion_vault("0xStrategist", "N", "S", 0, 0, 0)
 
     @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
     def test_create_orion_vault_invalid_name_symbol(self):
@@ -443,6 +504,10 @@ class TestVaultFactory:
         with pytest.raises(ValueError, match="exceeds maximum length of 26 bytes"):
             factory.create_orion_vault("0xStrategist", "A" * 27, "SYM", 0, 0, 0)
 
+        # Length is measured in UTF-8 bytes, not characters
+        with pytest.raises(ValueError, match="exceeds maximum length of 26 bytes"):
+            factory.create_orion_vault("0xStrategist", "é" * 14, "SYM", 0, 0, 0)
+
         # Symbol too long (> 4 bytes)
         with pytest.raises(ValueError, match="exceeds maximum length of 4 bytes"):
             factory.create_orion_vault("0xStrategist", "Name", "SYMB1", 0, 0, 0)
@@ -481,42 +546,27 @@ class TestVaultFactory:
             with pytest.raises(ValueError, match="Unsupported vault type"):
                 VaultFactory(vault_type="unknown")
 
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_create_orion_vault_fee_exceeds_max(self, MockConfig):
+    @pytest.mark.parametrize(
+        ("performance_fee", "management_fee", "match"),
+        [
+            (3001, 0, r"Performance fee .* exceeds maximum"),
+            (0, 301, r"Management fee .* exceeds maximum"),
+        ],
+    )
+    def test_create_orion_vault_fee_exceeds_max(
+        self, vault_factory, performance_fee, management_fee, match
+    ):
         """Test vault creation fails when performance or management fee exceeds max."""
-        config_instance = MockConfig.return_value
-        config_instance.is_system_idle.return_value = True
-        config_instance.is_whitelisted_manager.return_value = True
-        config_instance.contract.functions.transparentVaultFactory().call.return_value = "0xTVF"
-        config_instance.max_performance_fee = 3000
-        config_instance.max_management_fee = 300
-
-        factory = VaultFactory(VaultType.TRANSPARENT)
-        factory.contract.functions.createVault.return_value.estimate_gas.return_value = 100000
+        factory, _ = vault_factory
 
-        with pytest.raises(ValueError, match=r"Performance fee .* exceeds maximum"):
-            factory.create_orion_vault("0xStrategist", "N", "S", 0, 3001, 0)
-        with pytest.raises(ValueError, match=r"Management fee .* exceeds maximum"):
-            factory.create_orion_vault("0xStrategist", "N", "S", 0, 0, 301)
+        with pytest.raises(ValueError, match=match):
+            factory.create_orion_vault(
+                "0xStrategist", "N", "S", 0, performance_fee, management_fee
+            )
 
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_load_abi", "mock_env")
-    def test_create_orion_vault_whitelist_revert(self, MockConfig, mock_w3):
+    def test_create_orion_vault_whitelist_revert(self, vault_factory, mock_w3):
         """Test vault creation when tx reverts with not-whitelisted selector."""
-        config_instance = MockConfig.return_value
-        config_instance.is_system_idle.return_value = True
-        config_instance.is_whitelisted_manager.return_value = True
-        config_instance.contract.functions.transparentVaultFactory().call.return_value = "0xTVF"
-
-        factory = VaultFactory(VaultType.TRANSPARENT)
-        factory.contract.functions.createVault.return_value.estimate_gas.return_value = 100000
-        factory.contract.functions.createVault.return_value.build_transaction.return_value = {}
-        mock_w3.eth.account.from_key.return_value.address = "0xDeployer"
-        mock_w3.eth.account.from_key.return_value.sign_transaction.return_value = (
-            MagicMock(raw_transaction=b"raw")
-        )
-        mock_w3.eth.send_raw_transaction.return_value = b"\x00" * 32
+        factory, _ = vault_factory
         mock_w3.eth.wait_for_transaction_receipt.side_effect = Exception(
             "revert 0xea8e4eb5..."
         )
@@ -524,23 +574,9 @@ class TestVaultFactory:
         with pytest.raises(ValueError, match="not whitelisted to create vaults"):
             factory.create_orion_vault("0xStrategist", "N", "S", 0, 0, 0)
 
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_load_abi", "mock_env")
-    def test_create_orion_vault_receipt_failed(self, MockConfig, mock_w3):
+    def test_create_orion_vault_receipt_failed(self, vault_factory, mock_w3):
         """Test vault creation when receipt status is 0."""
-        config_instance = MockConfig.return_value
-        config_instance.is_system_idle.return_value = True
-        config_instance.is_whitelisted_manager.return_value = True
-        config_instance.contract.functions.transparentVaultFactory().call.return_value = "0xTVF"
-
-        factory = VaultFactory(VaultType.TRANSPARENT)
-        factory.contract.functions.createVault.return_value.estimate_gas.return_value = 100000
-        factory.contract.functions.createVault.return_value.build_transaction.return_value = {}
-        mock_w3.eth.account.from_key.return_value.address = "0xDeployer"
-        mock_w3.eth.account.from_key.return_value.sign_transaction.return_value = (
-            MagicMock(raw_transaction=b"raw")
-        )
-        mock_w3.eth.send_raw_transaction.return_value = b"\x00" * 32
+        factory, _ = vault_factory
         mock_w3.eth.wait_for_transaction_receipt.return_value = {
             "status": 0,
             "logs": [],
@@ -553,16 +589,9 @@ class TestVaultFactory:
 class TestOrionVaults:
     """Tests for OrionVault and subclasses."""
 
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_load_abi", "mock_env")
-    def test_orion_vault_methods(self, MockConfig, mock_w3):
+    def test_orion_vault_methods(self, transparent_vault, mock_w3):
         """Test base methods."""
-        # Mock config for update_fee_model calls
-        config_instance = MockConfig.return_value
-        config_instance.is_system_idle.return_value = True
-        config_instance.orion_transparent_vaults = ["0xVault"]
-
-        vault = OrionTransparentVault()
+        vault, _ = transparent_vault
 
         # Mock fee limit calls
         vault.contract.functions.MAX_PERFORMANCE_FEE.return_value.call.return_value = (
@@ -625,18 +654,12 @@ class TestOrionVaults:
             assert vault.can_request_deposit("0xUser") is True
             mock_ac_instance.functions.canRequestDeposit().call.return_value = False
             assert vault.can_request_deposit("0xUser") is False
+            # The access control contract is built once per address
+            mock_ac_contract.assert_called_once()
 
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_orion_vault_v2_features(self, MockConfig, mock_w3):
+    def test_orion_vault_v2_features(self, transparent_vault):
         """Test v2.0.0 vault features: async operations and new getters."""
-        # Setup config
-        config_instance = MockConfig.return_value
-        config_instance.orion_transparent_vaults = ["0xVault"]
-        config_instance.is_system_idle.return_value = True
-        config_instance.max_fulfill_batch_size = 10
-
-        vault = OrionTransparentVault()
+        vault, _ = transparent_vault
 
         # Test new getters
         vault.contract.functions.activeFeeModel.return_value.call.return_value = (
@@ -690,18 +713,10 @@ class TestOrionVaults:
         assert res.receipt["status"] == 1
         vault.contract.functions.cancelRedeemRequest.assert_called_with(50)
 
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_execute_vault_tx_with_gas_limit(self, MockConfig):
+    def test_execute_vault_tx_with_gas_limit(self, transparent_vault):
         """Test _execute_vault_tx includes gas in tx_params when gas_limit is provided."""
-        config_instance = MockConfig.return_value
-        config_instance.orion_transparent_vaults = ["0xVault"]
-        config_instance.is_system_idle.return_value = True
-
-        vault = OrionTransparentVault()
+        vault, _ = transparent_vault
         vault.contract.functions.requestDeposit.return_value.build_transaction.return_value = {}
-        vault_w3 = vault.w3
-        vault_w3.eth.account.from_key.return_value.address = "0xDeployer"
 
         gas_limit = 500_000
         res = vault._execute_vault_tx(
@@ -715,30 +730,99 @@ class TestOrionVaults:
             0
         ][0]
         assert call_args.get("gas") == gas_limit
+        assert call_args.get("chainId") == 11155111
+        # An explicit gas limit skips the estimate
+        vault.contract.functions.requestDeposit.return_value.estimate_gas.assert_not_called()
 
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_can_request_deposit_no_method(self, MockConfig):
-        """Test can_request_deposit when contract method is missing."""
-        config_instance = MockConfig.return_value
-        config_instance.orion_transparent_vaults = ["0xVault"]
+    def test_execute_vault_tx_leaves_fees_to_web3(self, transparent_vault):
+        """Vault transactions supply nonce and chain ID; web3 fills fees and gas."""
+        vault, _ = transparent_vault
+        request_deposit = vault.contract.functions.requestDeposit
+        request_deposit.return_value.build_transaction.return_value = {}
 
-        vault = OrionTransparentVault()
+        vault.request_deposit(100)
+
+        request_deposit.return_value.build_transaction.assert_called_once_with(
+            {"from": "0xDeployer", "nonce": 0, "chainId": 11155111}
+        )
+        vault.w3.batch_requests.assert_not_called()
+
+    def test_execute_many(self, transparent_vault, mock_w3):
+        """execute_many reads the nonce once and numbers the transactions locally."""
+        vault, _ = transparent_vault
+        mock_w3.eth.get_transaction_count.return_value = 7
+        functions = vault.contract.functions
+        for fn in (functions.requestDeposit, functions.requestRedeem):
+            fn.return_value.estimate_gas.return_value = 100
+            fn.return_value.build_transaction.return_value = {}
+
+        results = vault.execute_many(
+            [functions.requestDeposit(100), functions.requestRedeem(50)]
+        )
+
+        assert [res.receipt["status"] for res in results] == [1, 1]
+        mock_w3.eth.get_transaction_count.assert_called_once()
+        assert mock_w3.eth.send_raw_transaction.call_count == 2
+        deposit_tx = functions.requestDeposit.return_value.build_transaction.call_args[
+            0
+        ][0]
+        redeem_tx = functions.requestRedeem.return_value.build_transaction.call_args[0][
+            0
+        ]
+        assert (deposit_tx["nonce"], redeem_tx["nonce"]) == (7, 8)
+        assert deposit_tx["gas"] == redeem_tx["gas"] == 120
+
+    def test_execute_many_partial_failure(self, transparent_vault, mock_w3):
+        """A failed receipt mid-batch still waits for the rest and reports every hash."""
+        vault, _ = transparent_vault
+        hashes = [bytes([i]) * 32 for i in range(3)]
+        mock_w3.eth.send_raw_transaction.side_effect = hashes
+        mock_w3.eth.wait_for_transaction_receipt.side_effect = [
+            AttributeDict({"status": status, "transactionHash": tx_hash, "logs": []})
+            for status, tx_hash in zip((1, 0, 1), hashes)
+        ]
+        fn = vault.contract.functions.requestDeposit
+        fn.return_value.estimate_gas.return_value = 100
+        fn.return_value.build_transaction.return_value = {}
+
+        with pytest.raises(TransactionBatchError, match="1 of 3") as exc_info:
+            vault.execute_many([fn(1), fn(2), fn(3)])
+
+        error = exc_info.value
+        assert error.tx_hashes == [tx_hash.hex() for tx_hash in hashes]
+        assert [res.receipt["status"] for res in error.results] == [1, 0, 1]
+        assert mock_w3.eth.wait_for_transaction_receipt.call_count == 3
+
+    def test_execute_many_send_failure(self, transparent_vault, mock_w3):
+        """A send error mid-batch still reports the transactions already broadcast."""
+        vault, _ = transparent_vault
+        send_error = Web3RPCError("nonce too low")
+        mock_w3.eth.send_raw_transaction.side_effect = [b"\x01" * 32, send_error]
+        fn = vault.contract.functions.requestDeposit
+        fn.return_value.estimate_gas.return_value = 100
+        fn.return_value.build_transaction.return_value = {}
+
+        with pytest.raises(TransactionBatchError, match="1 of 3") as exc_info:
+            vault.execute_many([fn(1), fn(2), fn(3)])
+
+        error = exc_info.value
+        assert error.__cause__ is send_error
+        assert error.tx_hashes == [(b"\x01" * 32).hex()]
+        assert [res.receipt["status"] for res in error.results] == [1]
+        assert fn.return_value.build_transaction.call_count == 2
+        mock_w3.eth.wait_for_transaction_receipt.assert_called_once()
+
+    def test_can_request_deposit_no_method(self, transparent_vault):
+        """Test can_request_deposit when contract method is missing."""
+        vault, _ = transparent_vault
         # Simulate ABI missing function or call error
         vault.contract.functions.depositAccessControl.side_effect = AttributeError
 
         assert vault.can_request_deposit("0xUser") is True
 
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_transparent_vault_submit(self, MockConfig):
+    def test_transparent_vault_submit(self, transparent_vault):
         """Test transparent vault submit."""
-        # Mock config validation
-        config_instance = MockConfig.return_value
-        config_instance.orion_transparent_vaults = ["0xVault"]
-        config_instance.is_system_idle.return_value = True
-
-        vault = OrionTransparentVault()
+        vault, _ = transparent_vault
         vault.contract.functions.strategist.return_value.call.return_value = (
             "0xDeployer"
         )
@@ -753,72 +837,47 @@ class TestOrionVaults:
 
         # Verify it used the contract function
         vault.contract.functions.submitIntent.assert_called()
-
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_submit_order_intent_system_not_idle(self, MockConfig):
-        """Test submit_order_intent raises SystemNotIdleError when system not idle."""
-        config_instance = MockConfig.return_value
-        config_instance.orion_transparent_vaults = ["0xVault"]
-        config_instance.is_system_idle.return_value = False
-
-        vault = OrionTransparentVault()
-        with pytest.raises(SystemNotIdleError, match="Cannot submit order intent"):
-            vault.submit_order_intent({"0xToken": 1})
-
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_submit_order_intent_receipt_failed(self, MockConfig, mock_w3):
-        """Test submit_order_intent when receipt status is 0."""
-        config_instance = MockConfig.return_value
-        config_instance.is_system_idle.return_value = True
-        config_instance.orion_transparent_vaults = ["0xVault"]
-
-        vault = OrionTransparentVault()
-        vault.contract.functions.strategist.return_value.call.return_value = (
-            "0xDeployer"
-        )
-        vault.contract.functions.submitIntent.return_value.estimate_gas.return_value = (
-            100
+        # Every field is supplied up front, from a single pre-flight batch
+        vault.w3.batch_requests.assert_called_once()
+        vault.contract.functions.submitIntent.return_value.build_transaction.assert_called_once_with(
+            {
+                "from": "0xDeployer",
+                "nonce": 0,
+                "gas": 120,
+                "gasPrice": 1000000000,
+                "chainId": 11155111,
+            }
         )
-        vault.contract.functions.submitIntent.return_value.build_transaction.return_value = {}
-        mock_w3.eth.account.from_key.return_value.address = "0xDeployer"
-        mock_w3.eth.wait_for_transaction_receipt.return_value = {
-            "status": 0,
-            "logs": [],
-        }
-
-        with pytest.raises(Exception, match="Transaction failed with status"):
-            vault.submit_order_intent({"0xA": 1})
 
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_transparent_vault_transfer_fees(self, MockConfig):
+    def test_transparent_vault_transfer_fees(self, transparent_vault):
         """Test transparent vault transfer fees."""
-        # Mock config validation
-        config_instance = MockConfig.return_value
-        config_instance.orion_transparent_vaults = ["0xVault"]
-        config_instance.is_system_idle.return_value = True
-
-        vault = OrionTransparentVault()
+        vault, _ = transparent_vault
         vault.contract.functions.manager.return_value.call.return_value = "0xDeployer"
         vault.contract.functions.claimVaultFees.return_value.build_transaction.return_value = {}
 
+        vault.contract.functions.claimVaultFees.return_value.estimate_gas.return_value = 100
+
         res = vault.transfer_manager_fees(100)
         assert res.receipt["status"] == 1
         vault.contract.functions.claimVaultFees.assert_called_with(100)
+        vault.contract.functions.claimVaultFees.return_value.build_transaction.assert_called_once_with(
+            {
+                "from": "0xDeployer",
+                "nonce": 0,
+                "gas": 120,
+                "gasPrice": 1000000000,
+                "chainId": 11155111,
+            }
+        )
 
     @patch("orion_finance_sdk_py.contracts.OrionConfig")
     @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_transfer_manager_fees_system_not_idle(self, MockConfig):
-        """Test transfer_manager_fees raises SystemNotIdleError when system not idle."""
-        config_instance = MockConfig.return_value
-        config_instance.orion_transparent_vaults = ["0xVault"]
-        config_instance.is_system_idle.return_value = False
+    def test_init_explicit_address(self, MockConfig):
+        """An explicit vault address takes precedence over ORION_VAULT_ADDRESS."""
+        vault = OrionTransparentVault("0xOtherVault")
 
-        vault = OrionTransparentVault()
-        with pytest.raises(SystemNotIdleError, match="Cannot transfer manager fees"):
-            vault.transfer_manager_fees(100)
+        assert vault.contract_address == "0xOtherVault"
+        MockConfig.return_value.is_orion_vault.assert_called_once_with("0xOtherVault")
 
     @patch("orion_finance_sdk_py.contracts.OrionConfig")
     @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
@@ -832,15 +891,9 @@ class TestOrionVaults:
         ):
             OrionVault("Test")
 
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_update_fee_model_errors(self, MockConfig):
+    def test_update_fee_model_errors(self, transparent_vault):
         """Test update_fee_model error conditions."""
-        config_instance = MockConfig.return_value
-        config_instance.is_system_idle.return_value = True
-        config_instance.orion_transparent_vaults = ["0xVault"]
-
-        vault = OrionTransparentVault()
+        vault, config_instance = transparent_vault
         # Mock max fees
         vault.contract.functions.MAX_PERFORMANCE_FEE.return_value.call.return_value = (
             3000
@@ -867,85 +920,18 @@ class TestOrionVaults:
         with pytest.raises(ValueError, match="Signer .* is not the vault manager"):
             vault.update_fee_model(0, 0, 0)
 
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_update_fee_model_receipt_failed(self, MockConfig, mock_w3):
-        """Test update_fee_model when receipt status is 0."""
-        config_instance = MockConfig.return_value
-        config_instance.is_system_idle.return_value = True
-        config_instance.orion_transparent_vaults = ["0xVault"]
-
-        vault = OrionTransparentVault()
-        vault.contract.functions.MAX_PERFORMANCE_FEE.return_value.call.return_value = (
-            3000
-        )
-        vault.contract.functions.MAX_MANAGEMENT_FEE.return_value.call.return_value = 300
-        vault.contract.functions.manager.return_value.call.return_value = "0xDeployer"
-        vault.contract.functions.updateFeeModel.return_value.build_transaction.return_value = {}
-        mock_w3.eth.account.from_key.return_value.address = "0xDeployer"
-        mock_w3.eth.wait_for_transaction_receipt.return_value = {
-            "status": 0,
-            "logs": [],
-        }
-
-        with pytest.raises(Exception, match="Transaction failed with status"):
-            vault.update_fee_model(0, 0, 0)
-
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_update_strategist_error(self, MockConfig):
-        """Test update_strategist error (signer != manager)."""
-        config_instance = MockConfig.return_value
-        config_instance.is_system_idle.return_value = True
-        config_instance.orion_transparent_vaults = ["0xVault"]
-
-        vault = OrionTransparentVault()
-        vault.contract.functions.manager.return_value.call.return_value = "0xOther"
-
-        with pytest.raises(ValueError, match="Signer .* is not the vault manager"):
-            vault.update_strategist("0xNew")
-
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_update_strategist_system_not_idle(self, MockConfig):
-        """Test update_strategist raises SystemNotIdleError when system not idle."""
-        config_instance = MockConfig.return_value
-        config_instance.is_system_idle.return_value = False
-        config_instance.orion_transparent_vaults = ["0xVault"]
-
-        vault = OrionTransparentVault()
-        with pytest.raises(SystemNotIdleError, match="Cannot update strategist"):
-            vault.update_strategist("0xNew")
-
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_update_strategist_receipt_failed(self, MockConfig, mock_w3):
-        """Test update_strategist when receipt status is 0."""
-        config_instance = MockConfig.return_value
-        config_instance.is_system_idle.return_value = True
-        config_instance.orion_transparent_vaults = ["0xVault"]
-
-        vault = OrionTransparentVault()
-        vault.contract.functions.manager.return_value.call.return_value = "0xDeployer"
-        vault.contract.functions.updateStrategist.return_value.build_transaction.return_value = {}
-        mock_w3.eth.account.from_key.return_value.address = "0xDeployer"
-        mock_w3.eth.wait_for_transaction_receipt.return_value = {
-            "status": 0,
-            "logs": [],
-        }
-
-        with pytest.raises(Exception, match="Transaction failed with status"):
-            vault.update_strategist("0xNew")
+    def test_missing_private_key(self, transparent_vault):
+        """Signing methods name the missing private key variable."""
+        vault, _ = transparent_vault
+        with patch.dict(os.environ, {"STRATEGIST_PRIVATE_KEY": ""}):
+            with pytest.raises(
+                ValueError, match="STRATEGIST_PRIVATE_KEY environment variable"
+            ):
+                vault.submit_order_intent({"0xA": 1})
 
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_set_dac_errors(self, MockConfig):
+    def test_set_dac_errors(self, transparent_vault):
         """Test set_deposit_access_control error conditions."""
-        config_instance = MockConfig.return_value
-        config_instance.is_system_idle.return_value = True
-        config_instance.orion_transparent_vaults = ["0xVault"]
-
-        vault = OrionTransparentVault()
+        vault, config_instance = transparent_vault
         vault.contract.functions.manager.return_value.call.return_value = "0xDeployer"
 
         # System not idle
@@ -959,30 +945,63 @@ class TestOrionVaults:
         with pytest.raises(ValueError, match="Signer .* is not the vault manager"):
             vault.set_deposit_access_control("0xNew")
 
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_submit_intent_error(self, MockConfig):
-        """Test submit_order_intent error (signer != strategist)."""
-        config_instance = MockConfig.return_value
-        config_instance.is_system_idle.return_value = True
-        config_instance.orion_transparent_vaults = ["0xVault"]
-
-        vault = OrionTransparentVault()
-        vault.contract.functions.strategist.return_value.call.return_value = "0xOther"
-
-        with pytest.raises(ValueError, match="Signer .* is not the vault strategist"):
-            vault.submit_order_intent({"0xA": 1})
-
-    @patch("orion_finance_sdk_py.contracts.OrionConfig")
-    @pytest.mark.usefixtures("mock_w3", "mock_load_abi", "mock_env")
-    def test_transfer_fees_error(self, MockConfig):
-        """Test transfer fees error (signer != manager)."""
-        config_instance = MockConfig.return_value
-        config_instance.is_system_idle.return_value = True
-        config_instance.orion_transparent_vaults = ["0xVault"]
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [
+            ("submit_order_intent", ({"0xA": 1},)),
+            ("update_fee_model", (0, 0, 0)),
+            ("update_strategist", ("0xNew",)),
+        ],
+    )
+    def test_vault_tx_receipt_failed(self, transparent_vault, mock_w3, method, args):
+        """Signing methods raise when the receipt status is 0."""
+        vault, _ = transparent_vault
+        functions = vault.contract.functions
+        functions.strategist.return_value.call.return_value = "0xDeployer"
+        functions.manager.return_value.call.return_value = "0xDeployer"
+        functions.MAX_PERFORMANCE_FEE.return_value.call.return_value = 3000
+        functions.MAX_MANAGEMENT_FEE.return_value.call.return_value = 300
+        functions.submitIntent.return_value.estimate_gas.return_value = 100
+        mock_w3.eth.wait_for_transaction_receipt.return_value = {
+            "status": 0,
+            "logs": [],
+        }
 
-        vault = OrionTransparentVault()
-        vault.contract.functions.manager.return_value.call.return_value = "0xOther"
+        with pytest.raises(Exception, match="Transaction failed with status"):
+            getattr(vault, method)(*args)
+
+    @pytest.mark.parametrize(
+        ("method", "args", "match"),
+        [
+            ("submit_order_intent", ({"0xToken": 1},), "Cannot submit order intent"),
+            ("transfer_manager_fees", (100,), "Cannot transfer manager fees"),
+            ("update_strategist", ("0xNew",), "Cannot update strategist"),
+        ],
+    )
+    def test_vault_tx_system_not_idle(self, transparent_vault, method, args, match):
+        """Signing methods raise SystemNotIdleError when the system is not idle."""
+        vault, config_instance = transparent_vault
+        config_instance.is_system_idle.return_value = False
 
-        with pytest.raises(ValueError, match="Signer .* is not the vault manager"):
-            vault.transfer_manager_fees(100)
+        with pytest.raises(SystemNotIdleError, match=match):
+            getattr(vault, method)(*args)
+
+    @pytest.mark.parametrize(
+        ("method", "args", "role", "match"),
+        [
+            ("submit_order_intent", ({"0xA": 1},), "strategist", "vault strategist"),
+            ("transfer_manager_fees", (100,), "manager", "vault manager"),
+            ("update_strategist", ("0xNew",), "manager", "vault manager"),
+        ],
+    )
+    def test_vault_tx_signer_mismatch(
+        self, transparent_vault, method, args, role, match
+    ):
+        """Signing methods reject a signer that does not hold the required role."""
+        vault, _ = transparent_vault
+        getattr(
+            vault.contract.functions, role
+        ).return_value.call.return_value = "0xOther"
+
+        with pytest.raises(ValueError, match=f"Signer .* is not the {match}"):
+            getattr(vault, method)(*args)
@@ -24,12 +24,8 @@ for _env_path in (
         load_dotenv(_env_path, override=True)
         break
 
-try:
-    from ape import accounts, networks
-
-    HAS_APE = True
-except ImportError:
-    HAS_APE = False
+pytest.importorskip("ape", reason="ape not installed")
+from ape import accounts, networks  # noqa: E402
 
 
 def _has_fork_config() -> bool:
@@ -38,10 +34,8 @@ def _has_fork_config() -> bool:
 
 
 @pytest.fixture(autouse=True)
-def _require_ape_and_fork_config():
-    """Skip fork tests when ape is not installed or fork env is not set."""
-    if not HAS_APE:
-        pytest.skip("ape not installed")
+def _require_fork_config():
+    """Skip fork tests when fork env is not set."""
     if not _has_fork_config():
         pytest.skip("Fork not configured: set ALCHEMY_API_KEY or RPC_URL in .env")
 
@@ -53,15 +47,42 @@ def sepolia_fork():
         yield
 
 
-def test_comprehensive_config_on_fork(sepolia_fork):
+@pytest.fixture(scope="module")
+def fork_config(sepolia_fork):
+    """OrionConfig on the shared fork; the read-only fork tests can reuse one wrapper."""
+    return OrionConfig()
+
+
+@pytest.fixture(scope="module")
+def fork_vaults(fork_config):
+    """Transparent vaults registered in OrionConfig, listed once for the module."""
+    return fork_config.orion_transparent_vaults
+
+
+@pytest.fixture(scope="module")
+def fork_first_vault(fork_vaults):
+    """Wrapper for the first registered vault; skips when the registry is empty."""
+    if not fork_vaults:
+        pytest.skip("No Orion Transparent Vaults found")
+    return OrionTransparentVault(fork_vaults[0])
+
+
+@pytest.fixture(scope="module")
+def fork_orchestrator(sepolia_fork):
+    """LiquidityOrchestrator on the shared fork; its getters read live state on each access."""
+    return LiquidityOrchestrator()
+
+
+def test_comprehensive_config_on_fork(fork_config, fork_orchestrator):
     """Extensive testing of OrionConfig and linked components on Sepolia fork."""
-    config = OrionConfig()
+    config = fork_config
     print(f"\n--- [OrionConfig @ {config.contract_address}] ---")
 
-    # 1. Intent Decimals
-    intent_decimals = config.strategist_intent_decimals
-    print(f"Strategist Intent Decimals: {intent_decimals}")
-    assert intent_decimals > 0
+    # 1. Protocol parameters, read in one JSON-RPC batch
+    snapshot = config.snapshot()
+    print(f"Strategist Intent Decimals: {snapshot.strategist_intent_decimals}")
+    assert snapshot.strategist_intent_decimals > 0
+    assert snapshot.underlying_asset == config.underlying_asset
 
     # 2. Whitelisting checks
     assets = config.whitelisted_assets
@@ -76,21 +97,20 @@ def test_comprehensive_config_on_fork(sepolia_fork):
         assert asset_decimals in [6, 18, 8]
 
     # 3. Fee Coefficients
-    print(f"V Fee Coeff: {config.v_fee_coefficient}")
-    print(f"RS Fee Coeff: {config.rs_fee_coefficient}")
+    print(f"V Fee Coeff: {snapshot.v_fee_coefficient}")
+    print(f"RS Fee Coeff: {snapshot.rs_fee_coefficient}")
 
     # 4. Test LiquidityOrchestrator integration
-    lo = LiquidityOrchestrator()
+    lo = fork_orchestrator
     print(f"\n--- [LiquidityOrchestrator @ {lo.contract_address}] ---")
     print(f"Target Buffer Ratio: {lo.target_buffer_ratio}")
     print(f"Epoch Duration: {lo.epoch_duration}s")
     assert lo.epoch_duration > 0
 
 
-def test_vault_getters_on_fork(sepolia_fork, monkeypatch):
+def test_vault_getters_on_fork(fork_vaults):
     """Dynamically discover and test OrionTransparentVaults from OrionConfig."""
-    config = OrionConfig()
-    vaults = config.orion_transparent_vaults
+    vaults = fork_vaults
 
     if not vaults:
         pytest.skip("No Orion Transparent Vaults found in OrionConfig")
@@ -99,30 +119,34 @@ def test_vault_getters_on_fork(sepolia_fork, monkeypatch):
 
     for i, vault_addr in enumerate(vaults):
         print(f"\n--- [Vault #{i}: {vault_addr}] ---")
-        monkeypatch.setenv("ORION_VAULT_ADDRESS", vault_addr)
-        vault = OrionTransparentVault()
-
-        assert vault.manager_address and isinstance(vault.manager_address, str)
-        assert vault.strategist_address and isinstance(vault.strategist_address, str)
-        assert vault.total_assets >= 0
-        assert vault.share_price > 0
-        assert vault.active_fee_model is not None
-        assert isinstance(vault.active_fee_model, dict)
+        vault = OrionTransparentVault(vault_addr)
+
+        # Read each getter once; the live ones are an eth_call per access
+        manager = vault.manager_address
+        strategist = vault.strategist_address
+        total_assets = vault.total_assets
+        share_price = vault.share_price
+        fee_model = vault.active_fee_model
         portfolio = vault.get_portfolio()
+
+        assert manager and isinstance(manager, str)
+        assert strategist and isinstance(strategist, str)
+        assert total_assets >= 0
+        assert share_price > 0
+        assert isinstance(fee_model, dict)
         assert isinstance(portfolio, dict)
 
-        print(f"Manager: {vault.manager_address}")
-        print(f"Strategist: {vault.strategist_address}")
-        print(f"Total Assets: {vault.total_assets}")
-        print(f"Share Price: {vault.share_price}")
-        print(f"Active Fee Model: {vault.active_fee_model}")
+        print(f"Manager: {manager}")
+        print(f"Strategist: {strategist}")
+        print(f"Total Assets: {total_assets}")
+        print(f"Share Price: {share_price}")
+        print(f"Active Fee Model: {fee_model}")
         print(f"Portfolio: {portfolio}")
 
 
-def test_vault_pending_state_readable_on_fork(sepolia_fork, monkeypatch):
+def test_vault_pending_state_readable_on_fork(fork_vaults, monkeypatch):
     """Pending deposit/redeem state is readable on fork; asserts types and non-negative values."""
-    config = OrionConfig()
-    vaults = config.orion_transparent_vaults
+    vaults = fork_vaults
     if not vaults:
         pytest.skip("No vaults to test pending ops")
 
@@ -144,9 +168,9 @@ def test_fork_connection(sepolia_fork):
     print(f"\n[Hardhat Fork] Latest Block: {block_number}")
 
 
-def test_orion_config_v2_properties_on_fork(sepolia_fork):
+def test_orion_config_v2_properties_on_fork(fork_config):
     """OrionConfig v2 properties against Sepolia fork state."""
-    config = OrionConfig()
+    config = fork_config
 
     assert config.min_deposit_amount >= 0
     assert config.min_redeem_amount >= 0
@@ -167,95 +191,75 @@ def test_orion_config_v2_properties_on_fork(sepolia_fork):
     )
 
 
-def test_orion_config_system_idle_on_fork(sepolia_fork):
+def test_orion_config_system_idle_on_fork(fork_config):
     """OrionConfig is_system_idle reflects chain state."""
-    config = OrionConfig()
+    config = fork_config
     idle = config.is_system_idle()
     assert isinstance(idle, bool)
 
 
-def test_orion_config_is_orion_vault_on_fork(sepolia_fork):
+def test_orion_config_is_orion_vault_on_fork(fork_config, fork_vaults):
     """OrionConfig is_orion_vault: registered vaults True, zero address False."""
-    config = OrionConfig()
-    vaults = config.orion_transparent_vaults
-
-    for addr in vaults:
-        assert config.is_orion_vault(addr) is True
+    config = fork_config
+    vaults = fork_vaults
 
-    assert config.is_orion_vault(ZERO_ADDRESS) is False
+    *registered, zero = config.are_orion_vaults([*vaults, ZERO_ADDRESS])
+    assert all(flag is True for flag in registered)
+    assert zero is False
 
 
-def test_orion_config_managers_whitelisted_on_fork(sepolia_fork, monkeypatch):
+def test_orion_config_managers_whitelisted_on_fork(fork_config, fork_vaults):
     """Every registered vault's manager is whitelisted in OrionConfig."""
-    config = OrionConfig()
-    vaults = config.orion_transparent_vaults
+    config = fork_config
+    vaults = fork_vaults
     if not vaults:
         pytest.skip("No Orion Transparent Vaults found")
 
     for vault_addr in vaults:
-        monkeypatch.setenv("ORION_VAULT_ADDRESS", vault_addr)
-        vault = OrionTransparentVault()
+        vault = OrionTransparentVault(vault_addr)
         manager = vault.manager_address
         assert config.is_whitelisted_manager(manager), (
             f"Manager {manager} of vault {vault_addr} should be whitelisted"
         )
 
 
-def test_liquidity_orchestrator_state_on_fork(sepolia_fork):
+def test_liquidity_orchestrator_state_on_fork(fork_orchestrator):
     """LiquidityOrchestrator slippage_tolerance, target_buffer_ratio, epoch_duration from chain."""
-    lo = LiquidityOrchestrator()
+    lo = fork_orchestrator
     assert lo.slippage_tolerance >= 0
     assert lo.target_buffer_ratio >= 0
     assert lo.epoch_duration > 0
 
 
-def test_vault_factory_address_matches_config_on_fork(sepolia_fork):
+def test_vault_factory_address_matches_config_on_fork(fork_config):
     """VaultFactory(transparent) address equals OrionConfig.transparentVaultFactory()."""
-    config = OrionConfig()
+    config = fork_config
     expected = config.contract.functions.transparentVaultFactory().call(_VIEW_CALL_TX)
     factory = VaultFactory(vault_type=VaultType.TRANSPARENT.value)
     assert factory.contract_address.lower() == expected.lower()
 
 
-def test_vault_fee_limits_and_fees_on_fork(sepolia_fork, monkeypatch):
+def test_vault_fee_limits_and_fees_on_fork(fork_first_vault):
     """Vault max_performance_fee, max_management_fee, pending_vault_fees from state."""
-    config = OrionConfig()
-    vaults = config.orion_transparent_vaults
-    if not vaults:
-        pytest.skip("No Orion Transparent Vaults found")
-
-    monkeypatch.setenv("ORION_VAULT_ADDRESS", vaults[0])
-    vault = OrionTransparentVault()
+    vault = fork_first_vault
 
     assert vault.max_performance_fee > 0
     assert vault.max_management_fee > 0
     assert vault.pending_vault_fees >= 0.0
 
 
-def test_vault_share_price_convert_consistency_on_fork(sepolia_fork, monkeypatch):
+def test_vault_share_price_convert_consistency_on_fork(fork_first_vault):
     """Vault share_price equals convertToAssets(10**decimals) from contract."""
-    config = OrionConfig()
-    vaults = config.orion_transparent_vaults
-    if not vaults:
-        pytest.skip("No Orion Transparent Vaults found")
-
-    monkeypatch.setenv("ORION_VAULT_ADDRESS", vaults[0])
-    vault = OrionTransparentVault()
+    vault = fork_first_vault
 
     decimals = vault.contract.functions.decimals().call(_VIEW_CALL_TX)
     one_share = 10**decimals
     assert vault.share_price == vault.convert_to_assets(one_share)
 
 
-def test_vault_can_request_deposit_and_max_deposit_on_fork(sepolia_fork, monkeypatch):
+def test_vault_can_request_deposit_and_max_deposit_on_fork(fork_first_vault):
     """Vault can_request_deposit and max_deposit for a receiver on fork."""
-    config = OrionConfig()
-    vaults = config.orion_transparent_vaults
-    if not vaults:
-        pytest.skip("No Orion Transparent Vaults found")
-
-    monkeypatch.setenv("ORION_VAULT_ADDRESS", vaults[0])
-    vault = OrionTransparentVault()
+    vault = fork_first_vault
 
     receiver = accounts.test_accounts[0].address
     can_deposit = vault.can_request_deposit(receiver)
@@ -265,52 +269,34 @@ def test_vault_can_request_deposit_and_max_deposit_on_fork(sepolia_fork, monkeyp
     assert max_dep >= 0
 
 
-def test_vault_is_decommissioning_on_fork(sepolia_fork, monkeypatch):
+def test_vault_is_decommissioning_on_fork(fork_first_vault):
     """Vault is_decommissioning reflects chain state."""
-    config = OrionConfig()
-    vaults = config.orion_transparent_vaults
-    if not vaults:
-        pytest.skip("No Orion Transparent Vaults found")
-
-    monkeypatch.setenv("ORION_VAULT_ADDRESS", vaults[0])
-    vault = OrionTransparentVault()
+    vault = fork_first_vault
     assert isinstance(vault.is_decommissioning, bool)
 
 
-def test_vault_pending_deposit_redeem_non_negative_on_fork(sepolia_fork, monkeypatch):
-    """Vault pending_deposit and pending_redeem are non-negative with default and explicit batch size."""
-    config = OrionConfig()
-    vaults = config.orion_transparent_vaults
-    if not vaults:
-        pytest.skip("No Orion Transparent Vaults found")
-
-    monkeypatch.setenv("ORION_VAULT_ADDRESS", vaults[0])
-    vault = OrionTransparentVault()
+def test_vault_pending_deposit_redeem_non_negative_on_fork(fork_first_vault):
+    """Vault pending_deposit and pending_redeem are non-negative with the default batch size."""
+    vault = fork_first_vault
 
-    batch = config.max_fulfill_batch_size
+    # The default is config.max_fulfill_batch_size; explicit sizes are covered above.
     assert vault.pending_deposit() >= 0
-    assert vault.pending_deposit(batch) >= 0
     assert vault.pending_redeem() >= 0
-    assert vault.pending_redeem(batch) >= 0
 
 
-def test_vault_portfolio_tokens_whitelisted_on_fork(sepolia_fork, monkeypatch):
+def test_vault_portfolio_tokens_whitelisted_on_fork(fork_config, fork_vaults):
     """Every token in a vault's portfolio is whitelisted in OrionConfig."""
-    config = OrionConfig()
-    vaults = config.orion_transparent_vaults
+    config = fork_config
+    vaults = fork_vaults
     if not vaults:
         pytest.skip("No Orion Transparent Vaults found")
 
-    whitelisted = {a.lower() for a in config.whitelisted_assets}
+    whitelisted = frozenset(a.lower() for a in config.whitelisted_assets)
 
     for vault_addr in vaults:
-        monkeypatch.setenv("ORION_VAULT_ADDRESS", vault_addr)
-        vault = OrionTransparentVault()
-        portfolio = vault.get_portfolio()
-        for token in portfolio:
-            assert token.lower() in whitelisted, (
-                f"Portfolio token {token} not whitelisted"
-            )
+        portfolio = OrionTransparentVault(vault_addr).get_portfolio()
+        missing = {token.lower() for token in portfolio} - whitelisted
+        assert not missing, f"Portfolio tokens {sorted(missing)} not whitelisted"
 
 
 def test_orion_config_uses_ape_provider_when_rpc_unset(sepolia_fork, monkeypatch):
@@ -342,9 +328,9 @@ def test_list_whitelisted_assets_logic_on_fork(sepolia_fork, capsys):
     assert "whitelisted" in out.lower() or "Total:" in out
 
 
-def test_get_investment_universe_on_fork(sepolia_fork):
+def test_get_investment_universe_on_fork(fork_config):
     """User path: get_investment_universe alias equals whitelisted_assets."""
-    config = OrionConfig()
+    config = fork_config
     universe = config.get_investment_universe
     assets = config.whitelisted_assets
     assert universe == assets
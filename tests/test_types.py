@@ -0,0 +1,14 @@
+"""Tests for the type definitions."""
+
+from orion_finance_sdk_py.types import FeeType, fee_type_to_int
+
+
+def test_fee_type_to_int_matches_onchain_enum():
+    """fee_type_to_int follows the on-chain FeeType numbering."""
+    assert fee_type_to_int == {
+        FeeType.ABSOLUTE.value: 0,
+        FeeType.SOFT_HURDLE.value: 1,
+        FeeType.HARD_HURDLE.value: 2,
+        FeeType.HIGH_WATER_MARK.value: 3,
+        FeeType.HURDLE_HWM.value: 4,
+    }